@@ -5,6 +5,8 @@ The main orchestrator for executing ritual chains.
 """
 
 from datetime import datetime
+from enum import Enum
+from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Optional
 
 from rege.orchestration.phase import Phase, PhaseResult, PhaseStatus
@@ -12,6 +14,14 @@ from rege.orchestration.chain import RitualChain, ChainExecution, ChainStatus
 from rege.orchestration.registry import ChainRegistry, get_chain_registry
 
 
+class RoutingSignal(Enum):
+    """Routing decision emitted for a phase result."""
+
+    CONTINUE = "continue"
+    RECOVER = "recover"
+    ABORT = "abort"
+
+
 class RitualChainOrchestrator:
     """
     Orchestrator for executing ritual chains.
@@ -19,14 +29,17 @@ class RitualChainOrchestrator:
     Handles phase execution, branching, escalation, and compensation.
     """
 
-    # Escalation triggers
-    ESCALATION_TRIGGERS = {
-        "depth_limit_exceeded": "EMERGENCY_RECOVERY",
-        "canon_candidate": "RITUAL_COURT",
-        "contradiction_detected": "RITUAL_COURT",
-        "fusion_required": "FUSE01",
-        "recovery_needed": "RECOVERY",
-    }
+    # Escalation triggers as (trigger, target) pairs
+    _ESCALATION_PAIRS = (
+        ("depth_limit_exceeded", "EMERGENCY_RECOVERY"),
+        ("canon_candidate", "RITUAL_COURT"),
+        ("contradiction_detected", "RITUAL_COURT"),
+        ("fusion_required", "FUSE01"),
+        ("recovery_needed", "RECOVERY"),
+    )
+
+    # Read-only trigger -> target mapping
+    ESCALATION_TRIGGERS = MappingProxyType(dict(_ESCALATION_PAIRS))
 
     def __init__(
         self,
@@ -45,6 +58,13 @@ class RitualChainOrchestrator:
         self._phase_handlers: Dict[str, Callable] = {}
         self._current_execution: Optional[ChainExecution] = None
         self._paused_executions: Dict[str, ChainExecution] = {}
+        self._signal_handlers: Dict[
+            RoutingSignal, Callable[[Phase, PhaseResult, ChainExecution], bool]
+        ] = {
+            RoutingSignal.CONTINUE: self._handle_continue,
+            RoutingSignal.RECOVER: self._handle_recover,
+            RoutingSignal.ABORT: self._handle_abort,
+        }
 
     def define_chain(self, name: str, phases: List[Phase]) -> RitualChain:
         """
@@ -128,65 +148,10 @@ class RitualChainOrchestrator:
 
             # Execute phases
             while current_phase:
-                execution.mark_running(current_phase.name)
-
-                # Check phase condition
-                if not current_phase.should_execute(execution.context):
-                    result = PhaseResult(
-                        phase_name=current_phase.name,
-                        status=PhaseStatus.SKIPPED,
-                    )
-                    execution.add_phase_result(result)
-
-                    # Move to next phase
-                    current_phase = chain.get_next_phase(current_phase.name)
-                    continue
-
-                # Execute the phase
-                result = self._execute_phase(current_phase, execution.context)
-                execution.add_phase_result(result)
-
-                # Handle failure
-                if result.status == PhaseStatus.FAILED:
-                    if current_phase.compensation:
-                        # Execute compensation
-                        execution.mark_compensating()
-                        comp_result = self._execute_phase(
-                            current_phase.compensation, execution.context
-                        )
-                        execution.add_phase_result(comp_result)
-                        execution.add_compensation(current_phase.name)
-
-                    if current_phase.required:
-                        execution.mark_failed(result.error or "Phase failed")
-                        break
-
-                # Update context with output
-                if result.output:
-                    mapped_output = current_phase.map_output(result.output)
-                    execution.context.update(mapped_output)
-
-                # Check for escalation
-                escalation = self._check_escalation(result, execution.context)
-                if escalation:
-                    execution.add_escalation(escalation)
-
-                # Select branch or next phase
-                branch = current_phase.select_branch(execution.context)
-                if branch:
-                    result.branch_taken = branch.name
-                    current_phase = chain.get_phase(branch.target_phase)
-                else:
-                    current_phase = chain.get_next_phase(current_phase.name)
-
-                # Pause in step mode
-                if step_mode and current_phase:
-                    execution.mark_paused()
-                    self._paused_executions[execution.execution_id] = execution
-                    break
+                current_phase = self._step(chain, current_phase, execution, step_mode)
 
             # Mark completed if not paused or failed
-            if execution.status == ChainStatus.RUNNING:
+            if execution.status is ChainStatus.RUNNING:
                 execution.mark_completed()
 
         except Exception as e:
@@ -239,46 +204,9 @@ class RitualChainOrchestrator:
 
         try:
             while current_phase:
-                execution.mark_running(current_phase.name)
-
-                # Execute phase
-                result = self._execute_phase(current_phase, execution.context)
-                execution.add_phase_result(result)
-
-                if result.status == PhaseStatus.FAILED:
-                    if current_phase.compensation:
-                        execution.mark_compensating()
-                        comp_result = self._execute_phase(
-                            current_phase.compensation, execution.context
-                        )
-                        execution.add_phase_result(comp_result)
-                        execution.add_compensation(current_phase.name)
-
-                    if current_phase.required:
-                        execution.mark_failed(result.error or "Phase failed")
-                        break
-
-                if result.output:
-                    mapped_output = current_phase.map_output(result.output)
-                    execution.context.update(mapped_output)
-
-                escalation = self._check_escalation(result, execution.context)
-                if escalation:
-                    execution.add_escalation(escalation)
-
-                branch = current_phase.select_branch(execution.context)
-                if branch:
-                    result.branch_taken = branch.name
-                    current_phase = chain.get_phase(branch.target_phase)
-                else:
-                    current_phase = chain.get_next_phase(current_phase.name)
-
-                if step_mode and current_phase:
-                    execution.mark_paused()
-                    self._paused_executions[execution_id] = execution
-                    break
-
-            if execution.status == ChainStatus.RUNNING:
+                current_phase = self._step(chain, current_phase, execution, step_mode)
+
+            if execution.status is ChainStatus.RUNNING:
                 execution.mark_completed()
 
         except Exception as e:
@@ -289,6 +217,71 @@ class RitualChainOrchestrator:
 
         return execution
 
+    def _step(
+        self,
+        chain: RitualChain,
+        phase: Phase,
+        execution: ChainExecution,
+        step_mode: bool,
+    ) -> Optional[Phase]:
+        """
+        Run a single phase of an execution.
+
+        Args:
+            chain: Chain being executed
+            phase: Phase to run
+            execution: Execution tracker
+            step_mode: If True, pause before the next phase
+
+        Returns:
+            The next phase to run, or None to stop
+        """
+        execution.mark_running(phase.name)
+
+        # Check phase condition
+        if not phase.should_execute(execution.context):
+            result = PhaseResult(
+                phase_name=phase.name,
+                status=PhaseStatus.SKIPPED,
+            )
+            execution.add_phase_result(result)
+            return chain.get_next_phase(phase.name)
+
+        # Execute the phase
+        result = self._execute_phase(phase, execution.context)
+        execution.add_phase_result(result)
+
+        # Route the result (compensation / abort on failure)
+        signal = self._route_result(phase, result)
+        if not self._signal_handlers[signal](phase, result, execution):
+            return None
+
+        # Update context with output
+        if result.output:
+            mapped_output = phase.map_output(result.output)
+            execution.context.update(mapped_output)
+
+        # Check for escalation
+        escalation = self._check_escalation(result, execution.context)
+        if escalation:
+            execution.add_escalation(escalation)
+
+        # Select branch or next phase
+        branch = phase.select_branch(execution.context)
+        if branch:
+            result.branch_taken = branch.name
+            next_phase = chain.get_phase(branch.target_phase)
+        else:
+            next_phase = chain.get_next_phase(phase.name)
+
+        # Pause in step mode
+        if step_mode and next_phase:
+            execution.mark_paused()
+            self._paused_executions[execution.execution_id] = execution
+            return None
+
+        return next_phase
+
     def _execute_phase(
         self,
         phase: Phase,
@@ -341,6 +334,54 @@ class RitualChainOrchestrator:
                 duration_ms=duration_ms,
             )
 
+    def _route_result(self, phase: Phase, result: PhaseResult) -> RoutingSignal:
+        """Classify a phase result into a routing signal."""
+        if result.status is not PhaseStatus.FAILED:
+            return RoutingSignal.CONTINUE
+        if phase.required:
+            return RoutingSignal.ABORT
+        return RoutingSignal.RECOVER
+
+    def _handle_continue(
+        self,
+        phase: Phase,
+        result: PhaseResult,
+        execution: ChainExecution,
+    ) -> bool:
+        """Proceed with the chain."""
+        return True
+
+    def _handle_recover(
+        self,
+        phase: Phase,
+        result: PhaseResult,
+        execution: ChainExecution,
+    ) -> bool:
+        """Compensate an optional phase failure and proceed."""
+        self._compensate(phase, execution)
+        return True
+
+    def _handle_abort(
+        self,
+        phase: Phase,
+        result: PhaseResult,
+        execution: ChainExecution,
+    ) -> bool:
+        """Compensate a required phase failure and stop the chain."""
+        self._compensate(phase, execution)
+        execution.mark_failed(result.error or "Phase failed")
+        return False
+
+    def _compensate(self, phase: Phase, execution: ChainExecution) -> None:
+        """Execute a phase's compensation, if defined."""
+        if not phase.compensation:
+            return
+
+        execution.mark_compensating()
+        comp_result = self._execute_phase(phase.compensation, execution.context)
+        execution.add_phase_result(comp_result)
+        execution.add_compensation(phase.name)
+
     def _invoke_via_dispatcher(
         self,
         phase: Phase,
@@ -385,22 +426,24 @@ class RitualChainOrchestrator:
         context: Dict[str, Any],
     ) -> Optional[str]:
         """Check if an escalation should be triggered."""
+        targets = self.ESCALATION_TRIGGERS
+
         # Check depth limit
         if context.get("depth_exceeded"):
-            return "EMERGENCY_RECOVERY"
+            return targets["depth_limit_exceeded"]
 
         # Check for canon candidate
         charge = context.get("charge", 50)
         if charge >= 71:
-            return "RITUAL_COURT"
+            return targets["canon_candidate"]
 
         # Check for contradiction
         if context.get("contradiction"):
-            return "RITUAL_COURT"
+            return targets["contradiction_detected"]
 
         # Check for fusion trigger
         if context.get("fusion_required"):
-            return "FUSE01"
+            return targets["fusion_required"]
 
         return None
 
@@ -459,8 +502,13 @@ class RitualChainOrchestrator:
         while current_phase and current_phase.name not in visited:
             visited.add(current_phase.name)
 
-            would_execute = current_phase.should_execute(context)
-            branch = current_phase.select_branch(context) if would_execute else None
+            if not context and current_phase.is_static:
+                # Routing does not depend on context: walk the graph directly
+                would_execute = True
+                branch = current_phase.static_branch()
+            else:
+                would_execute = current_phase.should_execute(context)
+                branch = current_phase.select_branch(context) if would_execute else None
 
             planned_phases.append({
                 "name": current_phase.name,
@@ -64,6 +64,28 @@ class PhaseResult:
         )
 
 
+def _safe_condition(
+    condition: Callable[[Dict[str, Any]], bool],
+) -> Callable[[Dict[str, Any]], bool]:
+    """Wrap a condition so that evaluation errors count as a non-match."""
+
+    def safe(context: Dict[str, Any]) -> bool:
+        try:
+            return condition(context)
+        except Exception:
+            return False
+
+    return safe
+
+
+def _bind_condition(owner: Union["Branch", "Phase"]) -> None:
+    """Wrap the owner's current condition and record whether it always holds."""
+    condition = owner.condition
+    owner._bound_condition = condition
+    owner._condition = None if condition is None else _safe_condition(condition)
+    owner._static = condition is None or getattr(condition, "_static", False)
+
+
 @dataclass
 class Branch:
     """
@@ -78,12 +100,21 @@ class Branch:
     priority: int = 0
     description: str = ""
 
+    def __post_init__(self):
+        _bind_condition(self)
+
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """Evaluate if this branch should be taken."""
-        try:
-            return self.condition(context)
-        except Exception:
-            return False
+        if self.condition is not self._bound_condition:
+            _bind_condition(self)
+        return self._condition(context)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether this branch's condition always evaluates true."""
+        if self.condition is not self._bound_condition:
+            _bind_condition(self)
+        return self._static
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (without callable)."""
@@ -123,15 +154,16 @@ class Phase:
             raise ValueError("Phase organ is required")
         if not self.mode:
             raise ValueError("Phase mode is required")
+        _bind_condition(self)
 
     def should_execute(self, context: Dict[str, Any]) -> bool:
         """Check if this phase should execute given the context."""
-        if self.condition is None:
+        if self.condition is not self._bound_condition:
+            _bind_condition(self)
+        condition = self._condition
+        if condition is None:
             return True
-        try:
-            return self.condition(context)
-        except Exception:
-            return False
+        return condition(context)
 
     def select_branch(self, context: Dict[str, Any]) -> Optional[Branch]:
         """Select the first matching branch based on context."""
@@ -144,6 +176,19 @@ class Phase:
 
         return None
 
+    @property
+    def is_static(self) -> bool:
+        """Whether this phase and all its branches always evaluate true."""
+        if self.condition is not self._bound_condition:
+            _bind_condition(self)
+        return self._static and all(b.is_static for b in self.branches)
+
+    def static_branch(self) -> Optional[Branch]:
+        """Select the branch taken when every branch condition holds."""
+        if not self.branches:
+            return None
+        return max(self.branches, key=lambda b: b.priority)
+
     def get_input(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Get input for this phase from context using input_mapping."""
         if not self.input_mapping:
@@ -212,6 +257,8 @@ def charge_condition(min_charge: int = 0, max_charge: int = 100) -> Callable:
         charge = context.get("charge", 50)
         return min_charge <= charge <= max_charge
 
+    # A range covering every valid charge never rejects
+    condition._static = min_charge <= 0 and max_charge >= 100
     return condition
 
 
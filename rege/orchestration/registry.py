@@ -4,8 +4,11 @@ RE:GE Orchestration - Chain Registry.
 Global registry for managing ritual chains.
 """
 
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from rege.orchestration.chain import RitualChain, ChainExecution
 
@@ -20,8 +23,19 @@ class ChainRegistry:
     def __init__(self):
         """Initialize the registry."""
         self._chains: Dict[str, RitualChain] = {}
-        self._execution_history: List[ChainExecution] = []
         self._max_history: int = 1000
+        self._execution_history: Deque[ChainExecution] = deque(maxlen=self._max_history)
+        # Execution ID -> history entries with that ID, oldest first
+        self._execution_index: Dict[str, Deque[ChainExecution]] = {}
+        self._history_by_chain: Dict[str, Deque[ChainExecution]] = {}
+
+        # Running aggregates for get_execution_stats. Each execution object
+        # in history has one [execution, contribution, occurrences] record,
+        # keyed by id(); reads recount executions whose status or completion
+        # time no longer matches the recorded contribution.
+        self._stats_global: Dict[str, Any] = self._new_stats()
+        self._stats_by_chain: Dict[str, Dict[str, Any]] = {}
+        self._stats_entries: Dict[int, List[Any]] = {}
 
     def register(self, chain: RitualChain) -> bool:
         """
@@ -74,6 +88,10 @@ class ChainRegistry:
         """Get all registered chains."""
         return self._chains.copy()
 
+    def chains_view(self) -> Mapping[str, RitualChain]:
+        """Get a read-only live view of all registered chains, without copying."""
+        return MappingProxyType(self._chains)
+
     def count(self) -> int:
         """Get count of registered chains."""
         return len(self._chains)
@@ -86,18 +104,108 @@ class ChainRegistry:
 
     def add_execution(self, execution: ChainExecution) -> None:
         """Add an execution to history."""
+        # The bounded deque evicts the oldest entry on append
+        if len(self._execution_history) == self._max_history:
+            self._evict(self._execution_history[0])
+
         self._execution_history.append(execution)
+        self._history_by_chain.setdefault(execution.chain_name, deque()).append(execution)
+        self._execution_index.setdefault(execution.execution_id, deque()).append(execution)
+        self._count(execution)
+
+    def _evict(self, execution: ChainExecution) -> None:
+        """Drop the oldest execution from its per-chain history."""
+        chain_history = self._history_by_chain[execution.chain_name]
+        chain_history.popleft()
+        if not chain_history:
+            del self._history_by_chain[execution.chain_name]
+        self._forget(execution)
+
+    def _forget(self, execution: ChainExecution) -> None:
+        """Drop index and statistics entries for an execution leaving the history."""
+        entries = self._execution_index[execution.execution_id]
+        if entries[0] is execution:
+            entries.popleft()
+        else:
+            # Match by identity; copies of an execution compare equal
+            del entries[next(i for i, e in enumerate(entries) if e is execution)]
+        if not entries:
+            del self._execution_index[execution.execution_id]
+        self._uncount(execution)
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        """Create an empty statistics aggregate."""
+        return {
+            "total": 0,
+            "status_counts": {},
+            "total_duration": 0,
+            "completed_count": 0,
+        }
 
-        # Trim history if needed
-        while len(self._execution_history) > self._max_history:
-            self._execution_history.pop(0)
+    @staticmethod
+    def _contribution(execution: ChainExecution) -> Tuple[Any, ...]:
+        """
+        Get the (chain, status, duration, completed_at) an execution adds to
+        the statistics; completed_at is kept to detect later changes.
+        """
+        completed_at = execution.completed_at
+        duration = execution.get_duration_ms() if completed_at else None
+        return (execution.chain_name, execution.status.value, duration, completed_at)
+
+    def _count(self, execution: ChainExecution) -> None:
+        """Record one history occurrence of an execution in the statistics."""
+        key = id(execution)
+        record = self._stats_entries.get(key)
+        if record is None:
+            record = self._stats_entries[key] = [execution, self._contribution(execution), 0]
+        record[2] += 1
+        self._apply_stats(record[1], 1)
+
+    def _uncount(self, execution: ChainExecution) -> None:
+        """Remove one history occurrence of an execution from the statistics."""
+        key = id(execution)
+        record = self._stats_entries[key]
+        record[2] -= 1
+        self._apply_stats(record[1], -1)
+        if not record[2]:
+            del self._stats_entries[key]
+
+    def _refresh_stats(self) -> None:
+        """Recount executions in history whose status changed since counted."""
+        for record in self._stats_entries.values():
+            execution, contribution, occurrences = record
+            if (
+                execution.status.value != contribution[1]
+                or execution.completed_at != contribution[3]
+            ):
+                self._apply_stats(contribution, -occurrences)
+                record[1] = self._contribution(execution)
+                self._apply_stats(record[1], occurrences)
+
+    def _apply_stats(self, entry: Tuple[Any, ...], sign: int) -> None:
+        """Add (sign > 0) or subtract (sign < 0) a contribution sign times."""
+        chain_name, status, duration, _ = entry
+        chain_stats = self._stats_by_chain.setdefault(chain_name, self._new_stats())
+
+        for stats in (self._stats_global, chain_stats):
+            stats["total"] += sign
+            status_counts = stats["status_counts"]
+            status_counts[status] = status_counts.get(status, 0) + sign
+            if not status_counts[status]:
+                del status_counts[status]
+
+            if duration is not None:
+                stats["total_duration"] += sign * duration
+                stats["completed_count"] += sign
+
+        if not chain_stats["total"]:
+            del self._stats_by_chain[chain_name]
 
     def get_execution(self, execution_id: str) -> Optional[ChainExecution]:
         """Get an execution by ID."""
-        for execution in self._execution_history:
-            if execution.execution_id == execution_id:
-                return execution
-        return None
+        entries = self._execution_index.get(execution_id)
+        return entries[0] if entries else None
 
     def get_executions(
         self,
@@ -114,31 +222,35 @@ class ChainRegistry:
         Returns:
             List of executions, most recent first
         """
-        executions = self._execution_history.copy()
-
         if chain_name:
-            executions = [e for e in executions if e.chain_name == chain_name]
+            history = self._history_by_chain.get(chain_name, ())
+        else:
+            history = self._execution_history
 
         # Most recent first
-        executions.reverse()
-
-        return executions[:limit]
+        return list(islice(reversed(history), limit))
 
     def get_execution_stats(self, chain_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get execution statistics.
 
+        Executions changed after they were added are recounted here, so
+        the result always reflects the current history.
+
         Args:
             chain_name: Optional filter by chain name
 
         Returns:
             Statistics dictionary
         """
-        executions = self._execution_history
+        self._refresh_stats()
+
         if chain_name:
-            executions = [e for e in executions if e.chain_name == chain_name]
+            stats = self._stats_by_chain.get(chain_name)
+        else:
+            stats = self._stats_global
 
-        if not executions:
+        if not stats or not stats["total"]:
             return {
                 "total": 0,
                 "completed": 0,
@@ -147,22 +259,14 @@ class ChainRegistry:
                 "avg_duration_ms": 0,
             }
 
-        status_counts = {}
-        total_duration = 0
-        completed_count = 0
-
-        for execution in executions:
-            status = execution.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-            if execution.completed_at:
-                total_duration += execution.get_duration_ms()
-                completed_count += 1
-
-        avg_duration = total_duration // completed_count if completed_count > 0 else 0
+        status_counts = dict(stats["status_counts"])
+        completed_count = stats["completed_count"]
+        avg_duration = (
+            stats["total_duration"] // completed_count if completed_count > 0 else 0
+        )
 
         return {
-            "total": len(executions),
+            "total": stats["total"],
             "completed": status_counts.get("completed", 0),
             "failed": status_counts.get("failed", 0),
             "running": status_counts.get("running", 0),
@@ -182,14 +286,25 @@ class ChainRegistry:
             Number of executions cleared
         """
         if chain_name:
-            original_count = len(self._execution_history)
-            self._execution_history = [
-                e for e in self._execution_history if e.chain_name != chain_name
-            ]
-            return original_count - len(self._execution_history)
+            chain_history = self._history_by_chain.pop(chain_name, None)
+            if not chain_history:
+                return 0
+
+            for execution in chain_history:
+                self._forget(execution)
+            self._execution_history = deque(
+                (e for e in self._execution_history if e.chain_name != chain_name),
+                maxlen=self._max_history,
+            )
+            return len(chain_history)
         else:
             count = len(self._execution_history)
             self._execution_history.clear()
+            self._history_by_chain.clear()
+            self._execution_index.clear()
+            self._stats_global = self._new_stats()
+            self._stats_by_chain.clear()
+            self._stats_entries.clear()
             return count
 
     def set_max_history(self, max_entries: int) -> None:
@@ -197,47 +312,55 @@ class ChainRegistry:
         self._max_history = max(1, max_entries)
 
         # Trim if needed
-        while len(self._execution_history) > self._max_history:
-            self._execution_history.pop(0)
+        history = self._execution_history
+        while len(history) > self._max_history:
+            self._evict(history.popleft())
+        self._execution_history = deque(history, maxlen=self._max_history)
+
+    def iter_state(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield registry state section by section.
+
+        Lets callers serialize or stream one section at a time instead of
+        holding the whole exported dictionary.
+
+        Yields:
+            (section name, serializable value) pairs
+        """
+        yield "chains", {name: chain.to_dict() for name, chain in self._chains.items()}
+        yield "execution_history", [e.to_dict() for e in self._execution_history]
+        yield "max_history", self._max_history
 
     def to_dict(self) -> Dict[str, Any]:
         """Export registry state."""
-        return {
-            "chains": {name: chain.to_dict() for name, chain in self._chains.items()},
-            "execution_history": [e.to_dict() for e in self._execution_history],
-            "max_history": self._max_history,
-        }
+        return dict(self.iter_state())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChainRegistry":
         """Import registry state."""
         registry = cls()
-        registry._max_history = data.get("max_history", 1000)
+        registry.set_max_history(data.get("max_history", 1000))
 
         for name, chain_data in data.get("chains", {}).items():
             chain = RitualChain.from_dict(chain_data)
             registry.register(chain)
 
         for exec_data in data.get("execution_history", []):
-            execution = ChainExecution.from_dict(exec_data)
-            registry._execution_history.append(execution)
+            registry.add_execution(ChainExecution.from_dict(exec_data))
 
         return registry
 
 
-# Global singleton instance
-_global_registry: Optional[ChainRegistry] = None
+# Global singleton instance, created eagerly so the accessor is a plain read
+_global_registry: ChainRegistry = ChainRegistry()
 
 
 def get_chain_registry() -> ChainRegistry:
     """Get the global chain registry singleton."""
-    global _global_registry
-    if _global_registry is None:
-        _global_registry = ChainRegistry()
     return _global_registry
 
 
 def reset_chain_registry() -> None:
     """Reset the global chain registry (for testing)."""
     global _global_registry
-    _global_registry = None
+    _global_registry = ChainRegistry()
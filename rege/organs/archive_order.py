@@ -10,8 +10,10 @@ The Archive Order governs:
 - Canonical thread tagging
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
+from bisect import bisect_right
 from datetime import datetime, timedelta
+import hashlib
 import uuid
 
 from rege.organs.base import OrganHandler
@@ -19,9 +21,30 @@ from rege.core.models import Invocation, Patch, Fragment
 from rege.core.constants import get_tier, is_fusion_eligible, TIER_BOUNDARIES
 
 
+# Decay rate by charge band: LATENT, PROCESSING, ACTIVE, INTENSE+
+_DECAY_BREAKS = (26, 51, 71)
+_DECAY_RATES = (0.2, 0.1, 0.05, 0.01)
+
+
 class MemoryNode:
     """A memory node in the archive."""
 
+    __slots__ = (
+        "node_id",
+        "_content",
+        "_content_lower",
+        "_charge",
+        "_tier",
+        "tags",
+        "origin",
+        "version",
+        "created_at",
+        "last_accessed",
+        "access_count",
+        "decay_rate",
+        "linked_nodes",
+    )
+
     def __init__(
         self,
         content: str,
@@ -32,29 +55,65 @@ class MemoryNode:
         self.node_id = f"MEM_{uuid.uuid4().hex[:8].upper()}"
         self.content = content
         self.charge = charge
-        self.tags = tags
+        self.tags = list(tags)
         self.origin = origin
         self.version = 1
         self.created_at = datetime.now()
-        self.last_accessed = datetime.now()
+        self.last_accessed = self.created_at
         self.access_count = 0
         self.decay_rate = self._calculate_decay_rate()
         self.linked_nodes: List[str] = []
 
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._content_lower = value.lower()
+
+    @property
+    def charge(self) -> int:
+        return self._charge
+
+    @charge.setter
+    def charge(self, value: int) -> None:
+        self._charge = value
+        self._tier: Optional[str] = None
+
+    @property
+    def tier(self) -> str:
+        """Charge tier name, cached until the charge changes."""
+        if self._tier is None:
+            self._tier = get_tier(self._charge)
+        return self._tier
+
+    def add_tag(self, tag: str) -> None:
+        """Append a tag."""
+        self.tags.append(tag)
+
+    def search_texts(self) -> List[str]:
+        """Get the lowercased texts searched by matches()."""
+        # Tags are a plain list, so they are lowered at search time
+        return [self._content_lower, *(tag.lower() for tag in self.tags)]
+
+    def matches(self, query_lower: str) -> bool:
+        """Check if a lowercased query occurs in the content or a tag."""
+        return any(query_lower in text for text in self.search_texts())
+
     def _calculate_decay_rate(self) -> float:
         """Calculate decay rate based on charge."""
-        if self.charge >= 71:  # INTENSE+
-            return 0.01  # Very slow decay
-        elif self.charge >= 51:  # ACTIVE
-            return 0.05
-        elif self.charge >= 26:  # PROCESSING
-            return 0.1
-        else:  # LATENT
-            return 0.2  # Fast decay
-
-    def access(self) -> None:
-        """Record an access, refreshing the node."""
-        self.last_accessed = datetime.now()
+        return _DECAY_RATES[bisect_right(_DECAY_BREAKS, self.charge)]
+
+    def access(self, now: Optional[datetime] = None) -> None:
+        """
+        Record an access, refreshing the node.
+
+        Args:
+            now: Access time, so batch callers can share one timestamp
+        """
+        self.last_accessed = now or datetime.now()
         self.access_count += 1
         # Accessing slightly increases charge (up to 5 points)
         self.charge = min(100, self.charge + 1)
@@ -73,9 +132,9 @@ class MemoryNode:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "node_id": self.node_id,
-            "content": self.content,
-            "charge": self.charge,
-            "tags": self.tags,
+            "content": self._content,
+            "charge": self._charge,
+            "tags": list(self.tags),
             "origin": self.origin,
             "version": self.version,
             "created_at": self.created_at.isoformat(),
@@ -97,6 +156,13 @@ class ArchiveOrder(OrganHandler):
     - default: Standard archival
     """
 
+    # Mode -> handler method name; unknown modes use _default_archive
+    _MODE_HANDLERS: Dict[str, str] = {
+        "sacred_logging": "_sacred_logging",
+        "retrieval": "_retrieval",
+        "decay_check": "_decay_check",
+    }
+
     @property
     def name(self) -> str:
         return "ARCHIVE_ORDER"
@@ -108,21 +174,14 @@ class ArchiveOrder(OrganHandler):
     def __init__(self):
         super().__init__()
         self._nodes: Dict[str, MemoryNode] = {}
-        self._version_tracker: Dict[str, List[str]] = {}  # content hash -> node IDs
-        self._thread_tags: Dict[str, List[str]] = {}  # tag -> node IDs
+        self._version_tracker: Dict[bytes, List[str]] = {}  # content hash -> node IDs
+        self._thread_tags: Dict[str, Set[str]] = {}  # tag -> node IDs
+        self._node_list: List[MemoryNode] = []  # nodes in insertion order
 
     def invoke(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Process invocation through Archive Order."""
-        mode = invocation.mode.lower()
-
-        if mode == "sacred_logging":
-            return self._sacred_logging(invocation, patch)
-        elif mode == "retrieval":
-            return self._retrieval(invocation, patch)
-        elif mode == "decay_check":
-            return self._decay_check(invocation, patch)
-        else:
-            return self._default_archive(invocation, patch)
+        handler = self._MODE_HANDLERS.get(invocation.mode.lower(), "_default_archive")
+        return getattr(self, handler)(invocation, patch)
 
     def _sacred_logging(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Archive with full ritual weight."""
@@ -150,8 +209,9 @@ class ArchiveOrder(OrganHandler):
         results = self._search_nodes(query)
 
         # Access each result to refresh it
+        now = datetime.now()
         for node in results:
-            node.access()
+            node.access(now)
 
         return {
             "query": query,
@@ -184,7 +244,7 @@ class ArchiveOrder(OrganHandler):
         return {
             "node": node.to_dict(),
             "status": "archived",
-            "tier": get_tier(node.charge),
+            "tier": node.tier,
         }
 
     def create_memory_node(
@@ -218,14 +278,15 @@ class ArchiveOrder(OrganHandler):
 
             # Check if fusion should be triggered (3+ versions)
             if len(existing_ids) >= 3:
-                node.tags.append("VERSION_CONSOLIDATION_NEEDED+")
+                node.add_tag("VERSION_CONSOLIDATION_NEEDED+")
         else:
             self._version_tracker[content_key] = [node.node_id]
 
         self._nodes[node.node_id] = node
+        self._node_list.append(node)
 
-        # Index by tags
-        for tag in tags:
+        # Index by tags (duplicates collapsed, order kept)
+        for tag in dict.fromkeys(tags):
             self._index_by_thread(tag, node.node_id)
 
         return node
@@ -249,33 +310,22 @@ class ArchiveOrder(OrganHandler):
         return {
             "node_id": node_id,
             "current_charge": node.charge,
-            "tier": get_tier(node.charge),
+            "tier": node.tier,
             "days_since_access": days_since_access,
             "decay_rate": node.decay_rate,
             "projected_charge_7d": max(0, node.charge - int(node.decay_rate * 70)),
             "at_risk": node.charge <= TIER_BOUNDARIES["LATENT_MAX"],
         }
 
-    def _content_hash(self, content: str) -> str:
-        """Generate a simple hash for content deduplication."""
-        # Simple hash based on first 50 chars normalized
-        normalized = content.lower().strip()[:50]
-        return normalized
+    def _content_hash(self, content: str) -> bytes:
+        """Generate a fixed-size hash for content deduplication."""
+        normalized = content.lower().strip()
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
 
     def _search_nodes(self, query: str) -> List[MemoryNode]:
         """Search nodes by content or tags."""
         query_lower = query.lower()
-        results = []
-
-        for node in self._nodes.values():
-            # Content match
-            if query_lower in node.content.lower():
-                results.append(node)
-                continue
-
-            # Tag match
-            if any(query_lower in tag.lower() for tag in node.tags):
-                results.append(node)
+        results = [node for node in self._node_list if node.matches(query_lower)]
 
         # Sort by charge (highest first)
         results.sort(key=lambda n: n.charge, reverse=True)
@@ -284,36 +334,31 @@ class ArchiveOrder(OrganHandler):
     def _get_decaying_nodes(self) -> List[MemoryNode]:
         """Get nodes that are actively decaying."""
         threshold_days = 7
-        now = datetime.now()
+        cutoff = datetime.now() - timedelta(days=threshold_days)
 
-        decaying = []
-        for node in self._nodes.values():
-            days = (now - node.last_accessed).days
-            if days >= threshold_days and node.charge > 0:
-                decaying.append(node)
-
-        return sorted(decaying, key=lambda n: n.charge)
+        decaying = [
+            node for node in self._node_list
+            if node.last_accessed <= cutoff and node.charge > 0
+        ]
+        # Stable sort keeps insertion order among equal charges
+        decaying.sort(key=lambda n: n.charge)
+        return decaying
 
     def _get_latent_nodes(self) -> List[MemoryNode]:
         """Get nodes in LATENT tier."""
-        return [
-            node for node in self._nodes.values()
-            if node.charge <= TIER_BOUNDARIES["LATENT_MAX"]
-        ]
+        latent_max = TIER_BOUNDARIES["LATENT_MAX"]
+        return [node for node in self._node_list if node.charge <= latent_max]
 
     def _generate_thread_tag(self, node: MemoryNode) -> str:
         """Generate a canonical thread tag."""
         # Extract key words
-        words = node.content.split()[:2]
+        words = node.content.split(None, 2)[:2]
         base = "_".join(w.capitalize() for w in words)
         return f"{base}_Thread_{node.version:02d}"
 
     def _index_by_thread(self, tag: str, node_id: str) -> None:
         """Index a node by thread tag."""
-        if tag not in self._thread_tags:
-            self._thread_tags[tag] = []
-        if node_id not in self._thread_tags[tag]:
-            self._thread_tags[tag].append(node_id)
+        self._thread_tags.setdefault(tag, set()).add(node_id)
 
     def _generate_decay_recommendations(
         self,
@@ -5,10 +5,21 @@ RE:GE Organ Base - Abstract base class for organ handlers.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import os
+import sys
 
 from rege.core.models import Invocation, Patch, InvocationResult
 
 
+# Slotted dataclasses need Python 3.10; older interpreters keep __dict__
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def short_id(prefix: str) -> str:
+    """Generate a prefixed ID with 8 random uppercase hex digits."""
+    return f"{prefix}_{os.urandom(4).hex().upper()}"
+
+
 class OrganHandler(ABC):
     """
     Abstract base class for RE:GE organ handlers.
@@ -22,6 +33,8 @@ class OrganHandler(ABC):
     that can be routed to other organs or archived.
     """
 
+    __slots__ = ("_invocation_count", "_last_invocation", "_state")
+
     def __init__(self):
         """Initialize the organ handler."""
         self._invocation_count = 0
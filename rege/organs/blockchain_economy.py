@@ -10,18 +10,30 @@ The Blockchain Economy governs:
 - Chain integrity verification
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 import uuid
 import hashlib
 import json
 
-from rege.organs.base import OrganHandler
+from rege.organs.base import DATACLASS_SLOTS, OrganHandler
 from rege.core.models import Invocation, Patch
 
 
-@dataclass
+_encode_json_string = json.encoder.encode_basestring_ascii
+
+
+def _json_scalar(value: Any) -> str:
+    """Encode a scalar exactly as json.dumps would, skipping the encoder for common types."""
+    if isinstance(value, str):
+        return _encode_json_string(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    return json.dumps(value)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MythBlock:
     """
     A block in the mythic blockchain.
@@ -44,18 +56,25 @@ class MythBlock:
         if not self.hash:
             self.hash = self._calculate_hash()
 
+    def _envelope_text(self) -> Tuple[str, str]:
+        """Get the canonical JSON before and after the ritual_data value."""
+        # Keys in sort_keys order with json.dumps' default separators
+        prefix = (
+            '{"block_id": ' + _json_scalar(self.block_id)
+            + ', "charge": ' + _json_scalar(self.charge)
+            + ', "contributor": ' + _json_scalar(self.contributor)
+            + ', "nonce": ' + _json_scalar(self.nonce)
+            + ', "previous_hash": ' + _json_scalar(self.previous_hash)
+            + ', "ritual_data": '
+        )
+        suffix = ', "timestamp": ' + _json_scalar(self.timestamp.isoformat()) + "}"
+        return prefix, suffix
+
     def _calculate_hash(self) -> str:
         """Calculate the block's hash."""
-        block_string = json.dumps({
-            "block_id": self.block_id,
-            "previous_hash": self.previous_hash,
-            "timestamp": self.timestamp.isoformat(),
-            "contributor": self.contributor,
-            "charge": self.charge,
-            "ritual_data": self.ritual_data,
-            "nonce": self.nonce,
-        }, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        prefix, suffix = self._envelope_text()
+        data = json.dumps(self.ritual_data, sort_keys=True)
+        return hashlib.sha256((prefix + data + suffix).encode()).hexdigest()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize block to dictionary."""
@@ -71,7 +90,7 @@ class MythBlock:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RitualContract:
     """
     A smart ritual contract with promise and delivery conditions.
@@ -137,7 +156,9 @@ class BlockchainEconomy(OrganHandler):
     def __init__(self):
         super().__init__()
         self._chain: List[MythBlock] = []
+        self._blocks_by_contributor: Dict[str, List[int]] = {}
         self._contracts: Dict[str, RitualContract] = {}
+        self._contract_status_counts: Dict[str, int] = {}
         self._contributors: Dict[str, Dict[str, Any]] = {}
         self._initialize_genesis()
 
@@ -151,8 +172,13 @@ class BlockchainEconomy(OrganHandler):
             charge=100,
             ritual_data={"type": "genesis", "message": "In the beginning was the loop"},
         )
-        self._chain.append(genesis)
-        self._update_contributor_stats("SYSTEM", genesis)
+        self._append_block(genesis)
+
+    def _append_block(self, block: MythBlock) -> None:
+        """Append a block to the chain and its parallel indexes."""
+        self._blocks_by_contributor.setdefault(block.contributor, []).append(len(self._chain))
+        self._chain.append(block)
+        self._update_contributor_stats(block.contributor, block)
 
     def invoke(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Process invocation through Blockchain Economy."""
@@ -179,30 +205,28 @@ class BlockchainEconomy(OrganHandler):
         # Parse contributor from symbol or default to SELF
         contributor = invocation.symbol.strip().upper() if invocation.symbol else "SELF"
 
-        # Build ritual data
+        # Build ritual data, stamped with the same instant as the block
+        now = datetime.now()
         ritual_data = {
             "type": "ritual_record",
             "invocation_id": invocation.invocation_id,
             "depth": patch.depth,
             "flags": invocation.flags,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
 
         # Create new block
         new_block = MythBlock(
             block_id="",
             previous_hash=previous_block.hash,
-            timestamp=datetime.now(),
+            timestamp=now,
             contributor=contributor,
             charge=invocation.charge,
             ritual_data=ritual_data,
         )
 
-        # Add to chain
-        self._chain.append(new_block)
-
-        # Update contributor stats
-        self._update_contributor_stats(contributor, new_block)
+        # Add to chain and update contributor stats
+        self._append_block(new_block)
 
         return {
             "status": "minted",
@@ -215,16 +239,16 @@ class BlockchainEconomy(OrganHandler):
         """Verify the integrity of the blockchain."""
         is_valid = True
         errors = []
-        blocks_verified = 0
 
-        for i in range(1, len(self._chain)):
-            current = self._chain[i]
-            previous = self._chain[i - 1]
+        chain = self._chain
+        for i in range(1, len(chain)):
+            current = chain[i]
+            previous_hash = chain[i - 1].hash
 
             # Verify hash linkage
-            if current.previous_hash != previous.hash:
+            if current.previous_hash != previous_hash:
                 is_valid = False
-                errors.append(f"Block {i} hash mismatch: expected {previous.hash[:16]}...")
+                errors.append(f"Block {i} hash mismatch: expected {previous_hash[:16]}...")
 
             # Verify current block's hash
             recalculated = current._calculate_hash()
@@ -232,12 +256,10 @@ class BlockchainEconomy(OrganHandler):
                 is_valid = False
                 errors.append(f"Block {i} integrity violated")
 
-            blocks_verified += 1
-
         return {
             "status": "verified" if is_valid else "corrupted",
             "is_valid": is_valid,
-            "blocks_verified": blocks_verified,
+            "blocks_verified": len(self._chain) - 1,
             "chain_length": len(self._chain),
             "errors": errors,
             "genesis_hash": self._chain[0].hash[:16] + "...",
@@ -279,6 +301,7 @@ class BlockchainEconomy(OrganHandler):
         )
 
         self._contracts[contract.contract_id] = contract
+        self._count_contract_status(contract.status, 1)
 
         # Record contract creation on chain
         self._mint_contract_block(contract, "created")
@@ -320,7 +343,7 @@ class BlockchainEconomy(OrganHandler):
             }
 
         # Mark as fulfilled
-        contract.status = "fulfilled"
+        self._set_contract_status(contract, "fulfilled")
         contract.fulfilled_at = datetime.now()
 
         # Record fulfillment on chain
@@ -332,6 +355,20 @@ class BlockchainEconomy(OrganHandler):
             "fulfillment_charge": invocation.charge,
         }
 
+    def _set_contract_status(self, contract: RitualContract, status: str) -> None:
+        """Transition a contract's status, keeping the status counts current."""
+        self._count_contract_status(contract.status, -1)
+        contract.status = status
+        self._count_contract_status(status, 1)
+
+    def _count_contract_status(self, status: str, delta: int) -> None:
+        """Adjust the running count of contracts in a status."""
+        count = self._contract_status_counts.get(status, 0) + delta
+        if count:
+            self._contract_status_counts[status] = count
+        else:
+            self._contract_status_counts.pop(status, None)
+
     def _evaluate_contract(self, invocation: Invocation) -> Dict[str, Any]:
         """Evaluate contract status."""
         contract_id = invocation.symbol.strip().upper()
@@ -358,26 +395,26 @@ class BlockchainEconomy(OrganHandler):
     def _mint_contract_block(self, contract: RitualContract, action: str) -> None:
         """Mint a block recording contract action."""
         previous_block = self._chain[-1]
+        now = datetime.now()
 
         ritual_data = {
             "type": "contract_record",
             "contract_id": contract.contract_id,
             "action": action,
             "promise": contract.promise[:50],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
 
         block = MythBlock(
             block_id="",
             previous_hash=previous_block.hash,
-            timestamp=datetime.now(),
+            timestamp=now,
             contributor=contract.creator,
             charge=contract.charge_requirement,
             ritual_data=ritual_data,
         )
 
-        self._chain.append(block)
-        self._update_contributor_stats(contract.creator, block)
+        self._append_block(block)
 
     def _query_history(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Query block history."""
@@ -386,10 +423,13 @@ class BlockchainEconomy(OrganHandler):
         limit = 20
 
         # Get blocks based on filter
-        if filter_by:
+        if filter_by in self._blocks_by_contributor:
+            # A contributor key reads that contributor's blocks from the index
+            blocks = [self._chain[i].to_dict() for i in self._blocks_by_contributor[filter_by]]
+        elif filter_by:
             blocks = [
                 b.to_dict() for b in self._chain
-                if b.contributor == filter_by or filter_by in str(b.ritual_data)
+                if filter_by in str(b.ritual_data)
             ]
         else:
             blocks = [b.to_dict() for b in self._chain[-limit:]]
@@ -430,7 +470,7 @@ class BlockchainEconomy(OrganHandler):
         return {
             "status": "chain_status",
             "chain_length": len(self._chain),
-            "active_contracts": len([c for c in self._contracts.values() if c.status == "pending"]),
+            "active_contracts": self._contract_status_counts.get("pending", 0),
             "total_contracts": len(self._contracts),
             "total_contributors": len(self._contributors),
             "latest_block_hash": self._chain[-1].hash[:16] + "...",
@@ -439,18 +479,19 @@ class BlockchainEconomy(OrganHandler):
 
     def _update_contributor_stats(self, contributor: str, block: MythBlock) -> None:
         """Update statistics for a contributor."""
-        if contributor not in self._contributors:
-            self._contributors[contributor] = {
+        timestamp = block.timestamp.isoformat()
+        stats = self._contributors.get(contributor)
+        if stats is None:
+            stats = self._contributors[contributor] = {
                 "block_count": 0,
                 "total_charge": 0,
-                "first_contribution": block.timestamp.isoformat(),
-                "last_contribution": block.timestamp.isoformat(),
+                "first_contribution": timestamp,
+                "last_contribution": timestamp,
             }
 
-        stats = self._contributors[contributor]
         stats["block_count"] += 1
         stats["total_charge"] += block.charge
-        stats["last_contribution"] = block.timestamp.isoformat()
+        stats["last_contribution"] = timestamp
         stats["average_charge"] = stats["total_charge"] / stats["block_count"]
 
     def get_chain_length(self) -> int:
@@ -494,6 +535,8 @@ class BlockchainEconomy(OrganHandler):
         """Reset organ to initial state."""
         super().reset()
         self._chain = []
+        self._blocks_by_contributor = {}
         self._contracts = {}
+        self._contract_status_counts = {}
         self._contributors = {}
         self._initialize_genesis()
@@ -10,29 +10,95 @@ The Bloom Engine governs:
 - Loop expiration and ritual renewal
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta
-import uuid
+import re
 
-from rege.organs.base import OrganHandler
+from rege.organs.base import OrganHandler, short_id
 from rege.core.models import Invocation, Patch, Fragment
 from rege.core.constants import DepthLimits
 
 
+# Versioned symbols look like "Base_v1.2"
+_VERSION_RE = re.compile(r'(\w+)_v[\d.]+')
+
+# Charge tiers: standard (<51), active (51-70), intense (71-85), critical (86+)
+_CHARGE_TIER_BREAKS = (51, 71, 86)
+_TIER_DURATIONS = (7, 14, 21, 30)  # One week up to a month-long cycle
+_TIER_MUTATION_TYPES = (
+    "drift",          # Minor variation
+    "adaptation",     # Moderate change
+    "evolution",      # Significant growth
+    "metamorphosis",  # Complete transformation
+)
+
+# Growth recommendations accumulate at the intense (71) and critical (86) tiers
+_GROWTH_BREAKS = (71, 86)
+_GROWTH_RECOMMENDATIONS = (
+    ("Monitor for emergent patterns",),
+    ("Monitor for emergent patterns", "Consider version branching"),
+    (
+        "Monitor for emergent patterns",
+        "Consider version branching",
+        "Prepare for metamorphosis checkpoint",
+    ),
+)
+
+# Quarter, mid and final-quarter checkpoint offsets for each tier duration
+_CHECKPOINT_OFFSETS = {
+    days: (
+        timedelta(days=days // 4),
+        timedelta(days=days // 2),
+        timedelta(days=3 * days // 4),
+    )
+    for days in _TIER_DURATIONS
+}
+
+# Symbolic season for each calendar month, January first
+_SEASON_BY_MONTH = (
+    "WINTER", "WINTER",
+    "SPRING", "SPRING", "SPRING",
+    "SUMMER", "SUMMER", "SUMMER",
+    "AUTUMN", "AUTUMN", "AUTUMN",
+    "WINTER",
+)
+
+
 class BloomCycle:
     """A bloom cycle managing transformation phases."""
 
     MUTATION_DEPTH_LIMIT = 7  # Aligns with STANDARD depth limit
     MAX_VERSION_BRANCHES = 5  # Prevent infinite version branching
 
+    __slots__ = (
+        "_on_change",
+        "cycle_id",
+        "phase",
+        "trigger",
+        "mutation_path",
+        "duration",
+        "_status",
+        "mutation_depth",
+        "version_branches",
+        "_created_at",
+        "_created_iso",
+        "_ends_at",
+        "_ends_iso",
+        "mutations",
+    )
+
     def __init__(
         self,
         phase: str,
         trigger_event: str,
         mutation_path: str,
         duration_days: int,
+        created_at: Optional[datetime] = None,
     ):
-        self.cycle_id = f"CYCLE_{uuid.uuid4().hex[:8].upper()}"
+        self._on_change: Optional[Callable[["BloomCycle"], None]] = None
+        self.cycle_id = short_id("CYCLE")
         self.phase = phase
         self.trigger = trigger_event
         self.mutation_path = mutation_path
@@ -40,10 +106,39 @@ class BloomCycle:
         self.status = "pending"
         self.mutation_depth = 0
         self.version_branches = 0
-        self.created_at = datetime.now()
-        self.ends_at = datetime.now() + timedelta(days=duration_days)
+        now = created_at or datetime.now()
+        self.created_at = now
+        self.ends_at = now + timedelta(days=duration_days)
         self.mutations: List[Dict] = []
 
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value
+        self._created_iso = value.isoformat()
+
+    @property
+    def ends_at(self) -> datetime:
+        return self._ends_at
+
+    @ends_at.setter
+    def ends_at(self, value: datetime) -> None:
+        self._ends_at = value
+        self._ends_iso = value.isoformat()
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._status = value
+        if self._on_change is not None:
+            self._on_change(self)
+
     def initiate(self) -> str:
         """Initiate the bloom cycle."""
         if self.mutation_depth >= self.MUTATION_DEPTH_LIMIT:
@@ -72,12 +167,24 @@ class BloomCycle:
             "version_branches": self.version_branches,
         }
 
-    def add_mutation(self, mutation_type: str, description: str) -> None:
-        """Record a mutation event."""
+    def add_mutation(
+        self,
+        mutation_type: str,
+        description: str,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Record a mutation event.
+
+        Args:
+            mutation_type: Kind of mutation
+            description: What mutated
+            timestamp: When it happened (defaults to now)
+        """
         self.mutations.append({
             "type": mutation_type,
             "description": description,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (timestamp or datetime.now()).isoformat(),
         })
 
     def to_dict(self) -> Dict[str, Any]:
@@ -90,8 +197,8 @@ class BloomCycle:
             "status": self.status,
             "mutation_depth": self.mutation_depth,
             "version_branches": self.version_branches,
-            "created_at": self.created_at.isoformat(),
-            "ends_at": self.ends_at.isoformat(),
+            "created_at": self._created_iso,
+            "ends_at": self._ends_iso,
             "mutations": self.mutations,
         }
 
@@ -107,6 +214,14 @@ class BloomEngine(OrganHandler):
     - default: Standard bloom processing
     """
 
+    # Mode -> handler method name; unknown modes use _default_bloom
+    _MODE_HANDLERS: Dict[str, str] = {
+        "seasonal_mutation": "_seasonal_mutation",
+        "growth": "_growth",
+        "versioning": "_versioning",
+        "seasonal_growth": "_seasonal_mutation",
+    }
+
     @property
     def name(self) -> str:
         return "BLOOM_ENGINE"
@@ -120,21 +235,17 @@ class BloomEngine(OrganHandler):
         self._cycles: Dict[str, BloomCycle] = {}
         self._version_registry: Dict[str, List[str]] = {}  # base_id -> version_ids
         self._season_tracker: Dict[str, str] = {}  # entity -> current_season
+        self._active_cycles: Dict[str, BloomCycle] = {}
+        self._cycle_order: Dict[str, int] = {}  # cycle ID -> insertion order
+        self._next_order: int = 0
+        # IDs of consolidated cycles, earliest consolidated first
+        self._consolidated_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._max_cycles: int = 10000
 
     def invoke(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Process invocation through Bloom Engine."""
-        mode = invocation.mode.lower()
-
-        if mode == "seasonal_mutation":
-            return self._seasonal_mutation(invocation, patch)
-        elif mode == "growth":
-            return self._growth(invocation, patch)
-        elif mode == "versioning":
-            return self._versioning(invocation, patch)
-        elif mode == "seasonal_growth":
-            return self._seasonal_mutation(invocation, patch)
-        else:
-            return self._default_bloom(invocation, patch)
+        handler = self._MODE_HANDLERS.get(invocation.mode.lower(), "_default_bloom")
+        return getattr(self, handler)(invocation, patch)
 
     def _seasonal_mutation(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Process seasonal transformation."""
@@ -147,12 +258,12 @@ class BloomEngine(OrganHandler):
 
         # Determine mutation type
         mutation_type = self._determine_mutation_type(invocation.charge)
-        cycle.add_mutation(mutation_type, invocation.symbol[:100])
+        cycle.add_mutation(mutation_type, invocation.symbol[:100], cycle.created_at)
 
         return {
             "cycle": cycle.to_dict(),
             "mutation_type": mutation_type,
-            "mutated_fragment": self._create_mutated_fragment(invocation),
+            "mutated_fragment": self._create_mutated_fragment(invocation, mutation_type),
             "symbolic_schedule": self._generate_schedule(cycle),
         }
 
@@ -178,13 +289,11 @@ class BloomEngine(OrganHandler):
         """Manage fragment versions."""
         base_id = self._extract_base_id(invocation.symbol)
 
-        # Track version
-        if base_id not in self._version_registry:
-            self._version_registry[base_id] = []
-
-        version_count = len(self._version_registry[base_id]) + 1
+        # Track version; setdefault avoids a check-then-insert race
+        versions = self._version_registry.setdefault(base_id, [])
+        version_count = len(versions) + 1
         new_version_id = f"{base_id}_v{version_count}.0"
-        self._version_registry[base_id].append(new_version_id)
+        versions.append(new_version_id)
 
         # Check if consolidation needed
         consolidation_needed = version_count >= 3
@@ -193,7 +302,7 @@ class BloomEngine(OrganHandler):
             "base_id": base_id,
             "new_version": new_version_id,
             "total_versions": version_count,
-            "version_map": self._version_registry[base_id],
+            "version_map": versions,
         }
 
         if consolidation_needed:
@@ -232,9 +341,69 @@ class BloomEngine(OrganHandler):
             The created BloomCycle
         """
         cycle = BloomCycle(phase, trigger_event, mutation_path, duration_days)
-        self._cycles[cycle.cycle_id] = cycle
+        self._register_cycle(cycle)
+        self._trim_cycles()
         return cycle
 
+    def initiate_blooms(
+        self,
+        specs: Sequence[Tuple[str, str, str, int]],
+    ) -> List[BloomCycle]:
+        """
+        Initiate several bloom cycles that start at the same moment.
+
+        Args:
+            specs: (phase, trigger_event, mutation_path, duration_days) tuples
+
+        Returns:
+            The created BloomCycles, in spec order
+        """
+        now = datetime.now()
+        cycles = [BloomCycle(*spec, created_at=now) for spec in specs]
+        for cycle in cycles:
+            self._register_cycle(cycle)
+        self._trim_cycles()
+        return cycles
+
+    def _register_cycle(self, cycle: BloomCycle) -> None:
+        """Add a cycle to the registry and watch its status."""
+        cycle._on_change = self._cycle_status_changed
+        self._cycles[cycle.cycle_id] = cycle
+        self._cycle_order[cycle.cycle_id] = self._next_order
+        self._next_order += 1
+
+    def set_max_cycles(self, max_cycles: int) -> None:
+        """Set the maximum number of cycles to retain."""
+        self._max_cycles = max(1, max_cycles)
+        self._trim_cycles()
+
+    def _trim_cycles(self) -> None:
+        """
+        Evict the earliest consolidated cycles beyond the retention limit.
+
+        Pending and active cycles are never evicted, even once expired, so
+        the limit is soft while every retained cycle is unconsolidated.
+        """
+        excess = len(self._cycles) - self._max_cycles
+        consolidated = self._consolidated_ids
+        while excess > 0 and consolidated:
+            cycle_id, _ = consolidated.popitem(last=False)
+            # Detach so a retained reference cannot touch the indexes
+            self._cycles.pop(cycle_id)._on_change = None
+            del self._cycle_order[cycle_id]
+            excess -= 1
+
+    def _cycle_status_changed(self, cycle: BloomCycle) -> None:
+        """Keep the active and consolidated indexes in step with a cycle's status."""
+        if cycle.status == "active":
+            self._active_cycles[cycle.cycle_id] = cycle
+        else:
+            self._active_cycles.pop(cycle.cycle_id, None)
+        if cycle.status == "consolidated":
+            self._consolidated_ids.setdefault(cycle.cycle_id)
+        else:
+            self._consolidated_ids.pop(cycle.cycle_id, None)
+
     def branch_version(self, cycle_id: str) -> Dict[str, Any]:
         """
         Attempt to create a version branch.
@@ -282,80 +451,60 @@ class BloomEngine(OrganHandler):
 
     def _get_current_season(self) -> str:
         """Determine current symbolic season."""
-        month = datetime.now().month
-        if month in [3, 4, 5]:
-            return "SPRING"
-        elif month in [6, 7, 8]:
-            return "SUMMER"
-        elif month in [9, 10, 11]:
-            return "AUTUMN"
-        else:
-            return "WINTER"
+        return _SEASON_BY_MONTH[datetime.now().month - 1]
 
     def _calculate_duration(self, charge: int) -> int:
         """Calculate bloom duration based on charge."""
-        if charge >= 86:
-            return 30  # Critical - month-long cycle
-        elif charge >= 71:
-            return 21  # Intense - 3 weeks
-        elif charge >= 51:
-            return 14  # Active - 2 weeks
-        else:
-            return 7   # Standard - 1 week
+        return _TIER_DURATIONS[bisect_right(_CHARGE_TIER_BREAKS, charge)]
 
     def _determine_mutation_type(self, charge: int) -> str:
         """Determine mutation type based on charge."""
-        if charge >= 86:
-            return "metamorphosis"  # Complete transformation
-        elif charge >= 71:
-            return "evolution"      # Significant growth
-        elif charge >= 51:
-            return "adaptation"     # Moderate change
-        else:
-            return "drift"          # Minor variation
+        return _TIER_MUTATION_TYPES[bisect_right(_CHARGE_TIER_BREAKS, charge)]
 
-    def _create_mutated_fragment(self, invocation: Invocation) -> Dict[str, Any]:
+    def _create_mutated_fragment(
+        self,
+        invocation: Invocation,
+        mutation_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Create a mutated fragment from invocation."""
+        if mutation_type is None:
+            mutation_type = self._determine_mutation_type(invocation.charge)
+
         return {
-            "fragment_id": f"MUTANT_{uuid.uuid4().hex[:8].upper()}",
+            "fragment_id": short_id("MUTANT"),
             "source": invocation.symbol[:50],
             "charge": invocation.charge,
-            "mutation_type": self._determine_mutation_type(invocation.charge),
+            "mutation_type": mutation_type,
             "tags": invocation.flags + ["MUTATE+"],
         }
 
     def _generate_schedule(self, cycle: BloomCycle) -> Dict[str, Any]:
         """Generate a symbolic schedule for the cycle."""
+        duration = cycle.duration
+        offsets = _CHECKPOINT_OFFSETS.get(duration)
+        if offsets is None:
+            offsets = (
+                timedelta(days=duration // 4),
+                timedelta(days=duration // 2),
+                timedelta(days=3 * duration // 4),
+            )
+        quarter, mid, final_quarter = offsets
+        start = cycle.created_at
+
         return {
             "cycle_id": cycle.cycle_id,
-            "start_date": cycle.created_at.isoformat(),
-            "end_date": cycle.ends_at.isoformat(),
+            "start_date": cycle._created_iso,
+            "end_date": cycle._ends_iso,
             "checkpoints": [
-                {
-                    "name": "Quarter Point",
-                    "date": (cycle.created_at + timedelta(days=cycle.duration // 4)).isoformat(),
-                },
-                {
-                    "name": "Midpoint",
-                    "date": (cycle.created_at + timedelta(days=cycle.duration // 2)).isoformat(),
-                },
-                {
-                    "name": "Final Quarter",
-                    "date": (cycle.created_at + timedelta(days=3 * cycle.duration // 4)).isoformat(),
-                },
+                {"name": "Quarter Point", "date": (start + quarter).isoformat()},
+                {"name": "Midpoint", "date": (start + mid).isoformat()},
+                {"name": "Final Quarter", "date": (start + final_quarter).isoformat()},
             ],
         }
 
     def _growth_recommendations(self, charge: int) -> List[str]:
         """Generate growth recommendations based on charge."""
-        recommendations = ["Monitor for emergent patterns"]
-
-        if charge >= 71:
-            recommendations.append("Consider version branching")
-        if charge >= 86:
-            recommendations.append("Prepare for metamorphosis checkpoint")
-
-        return recommendations
+        return list(_GROWTH_RECOMMENDATIONS[bisect_right(_GROWTH_BREAKS, charge)])
 
     def _calculate_bloom_potential(self, charge: int) -> float:
         """Calculate bloom potential (0-1)."""
@@ -364,8 +513,7 @@ class BloomEngine(OrganHandler):
     def _extract_base_id(self, symbol: str) -> str:
         """Extract base ID from symbol for versioning."""
         # Look for version pattern
-        import re
-        match = re.search(r'(\w+)_v[\d.]+', symbol)
+        match = _VERSION_RE.search(symbol)
         if match:
             return match.group(1)
 
@@ -380,8 +528,8 @@ class BloomEngine(OrganHandler):
         return ["mutated_fragment", "symbolic_schedule", "version_map", "versioned_fragment"]
 
     def get_active_cycles(self) -> List[BloomCycle]:
-        """Get all active bloom cycles."""
-        return [c for c in self._cycles.values() if c.status == "active"]
+        """Get all active bloom cycles, in creation order."""
+        return sorted(self._active_cycles.values(), key=lambda c: self._cycle_order[c.cycle_id])
 
     def get_cycle(self, cycle_id: str) -> Optional[BloomCycle]:
         """Get a specific cycle."""
@@ -10,13 +10,14 @@ The Chamber of Commerce governs:
 - Economic ledger tracking
 """
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from bisect import bisect_right
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from datetime import date, datetime
 from dataclasses import dataclass, field
 from enum import Enum
-import uuid
+from functools import lru_cache
 
-from rege.organs.base import OrganHandler
+from rege.organs.base import DATACLASS_SLOTS, OrganHandler, short_id
 from rege.core.models import Invocation, Patch
 
 
@@ -27,7 +28,7 @@ class SymbolicCurrency(Enum):
     MIRRORCREDITS = "mirrorcredits"  # Earned through reflection and shadow work
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TradeRecord:
     """
     Record of a symbolic trade transaction.
@@ -47,7 +48,7 @@ class TradeRecord:
 
     def __post_init__(self):
         if not self.trade_id:
-            self.trade_id = f"TRADE_{uuid.uuid4().hex[:8].upper()}"
+            self.trade_id = short_id("TRADE")
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize trade record to dictionary."""
@@ -65,7 +66,7 @@ class TradeRecord:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MintRecord:
     """Record of currency minting."""
     mint_id: str
@@ -78,7 +79,7 @@ class MintRecord:
 
     def __post_init__(self):
         if not self.mint_id:
-            self.mint_id = f"MINT_{uuid.uuid4().hex[:8].upper()}"
+            self.mint_id = short_id("MINT")
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize mint record to dictionary."""
@@ -93,6 +94,11 @@ class MintRecord:
         }
 
 
+# Currency lookup by value, so trade parsing avoids Enum's raising constructor
+_CURRENCY_BY_NAME: Dict[str, SymbolicCurrency] = {c.value: c for c in SymbolicCurrency}
+_ALL_CURRENCY_NAMES = tuple(_CURRENCY_BY_NAME)
+
+
 # Valuation coefficients
 VALUATION_CONFIG = {
     "recursion_multiplier": 2,
@@ -102,6 +108,56 @@ VALUATION_CONFIG = {
     "mint_charge_threshold": 51,  # ACTIVE tier minimum
 }
 
+# Flags that add to a valuation, matched case-insensitively
+_VALUE_FLAGS = frozenset(("CANON+", "RITUAL+", "FUSE+", "ARCHIVE+"))
+
+
+def _flag_set(flags: List[str]) -> FrozenSet[str]:
+    """Uppercase an invocation's flags once into a set for hashed checks."""
+    return frozenset(f.upper() for f in flags)
+
+
+# Value tiers: trivial (<20), common (20-39), uncommon (40-59), rare (60-79), legendary (80+)
+_VALUE_TIER_BREAKS = (20, 40, 60, 80)
+_VALUE_TIERS = ("trivial", "common", "uncommon", "rare", "legendary")
+
+
+@lru_cache(maxsize=4096)
+def _compute_valuation(
+    charge: int,
+    recursion_depth: int,
+    flag_set: FrozenSet[str],
+    recursion_multiplier: int,
+    base_cost: int,
+) -> Tuple[int, str, int, str]:
+    """
+    Compute (value, tier, flag_bonus, suggested_currency) for a valuation.
+
+    Pure in its arguments, so results are memoized on the full tuple; the
+    config coefficients are passed in so edits to VALUATION_CONFIG miss the
+    cache instead of returning stale values. flag_set comes from _flag_set(),
+    so every flag check is case-insensitive.
+    """
+    # Count value-boosting flags
+    flag_bonus = 5 * len(flag_set & _VALUE_FLAGS)
+
+    # Calculate value: value = (recursion * 2 + charge) - cost + flag_bonus
+    raw_value = (recursion_depth * recursion_multiplier + charge) - base_cost + flag_bonus
+    value = max(0, raw_value)
+
+    # Determine value tier
+    tier = _VALUE_TIERS[bisect_right(_VALUE_TIER_BREAKS, value)]
+
+    # Suggest appropriate currency
+    if "DREAM+" in flag_set:
+        suggested_currency = SymbolicCurrency.DREAMPOINTS
+    elif "ECHO+" in flag_set or recursion_depth > 3:
+        suggested_currency = SymbolicCurrency.LOOPTOKENS
+    else:
+        suggested_currency = SymbolicCurrency.MIRRORCREDITS
+
+    return value, tier, flag_bonus, suggested_currency.value
+
 
 class ChamberOfCommerce(OrganHandler):
     """
@@ -116,6 +172,29 @@ class ChamberOfCommerce(OrganHandler):
     - default: Economy status
     """
 
+    __slots__ = (
+        "_balances",
+        "_circulation",
+        "_entity_totals",
+        "_trade_ledger",
+        "_mint_ledger",
+        "_trades_by_entity",
+        "_mints_by_recipient",
+        "_daily_minted",
+        "_day_cache",
+        "_day_key_cache",
+        "_valuation_cache",
+    )
+
+    # Mode -> handler method name; unknown modes use _default_economy
+    _MODE_HANDLERS: Dict[str, str] = {
+        "value": "_assess_value",
+        "trade": "_execute_trade",
+        "mint": "_mint_currency",
+        "ledger": "_query_ledger",
+        "balance": "_check_balance",
+    }
+
     @property
     def name(self) -> str:
         return "CHAMBER_OF_COMMERCE"
@@ -127,65 +206,40 @@ class ChamberOfCommerce(OrganHandler):
     def __init__(self):
         super().__init__()
         self._balances: Dict[str, Dict[str, int]] = {}  # entity -> {currency -> amount}
+        self._circulation: Dict[str, int] = self._count_circulation()
+        self._entity_totals: Dict[str, int] = self._count_entity_totals()
         self._trade_ledger: List[TradeRecord] = []
         self._mint_ledger: List[MintRecord] = []
+        self._trades_by_entity: Dict[str, List[int]] = {}  # entity -> trade ledger indices
+        self._mints_by_recipient: Dict[str, List[int]] = {}  # recipient -> mint ledger indices
         self._daily_minted: Dict[str, int] = {}  # date_str -> total_minted
+        self._day_cache: Optional[date] = None
+        self._day_key_cache: str = ""
         self._valuation_cache: Dict[str, Dict[str, Any]] = {}
 
     def invoke(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Process invocation through Chamber of Commerce."""
-        mode = invocation.mode.lower()
-
-        if mode == "value":
-            return self._assess_value(invocation, patch)
-        elif mode == "trade":
-            return self._execute_trade(invocation, patch)
-        elif mode == "mint":
-            return self._mint_currency(invocation, patch)
-        elif mode == "ledger":
-            return self._query_ledger(invocation, patch)
-        elif mode == "balance":
-            return self._check_balance(invocation, patch)
-        else:
-            return self._default_economy(invocation, patch)
+        handler = self._MODE_HANDLERS.get(invocation.mode.lower(), "_default_economy")
+        return getattr(self, handler)(invocation, patch)
 
     def _assess_value(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Assess symbolic value of a fragment/process."""
         symbol = invocation.symbol
         charge = invocation.charge
-        flags = invocation.flags
 
         # Calculate recursion factor from recurrence tracking
         recursion_depth = patch.depth + 1
 
-        # Count value-boosting flags
-        value_flags = ["CANON+", "RITUAL+", "FUSE+", "ARCHIVE+"]
-        flag_bonus = sum(5 for f in flags if f.upper() in value_flags)
-
-        # Calculate value: value = (recursion * 2 + charge) - cost + flag_bonus
         config = VALUATION_CONFIG
-        raw_value = (recursion_depth * config["recursion_multiplier"] + charge) - config["base_cost"] + flag_bonus
-        value = max(0, raw_value)
-
-        # Determine value tier
-        if value >= 80:
-            tier = "legendary"
-        elif value >= 60:
-            tier = "rare"
-        elif value >= 40:
-            tier = "uncommon"
-        elif value >= 20:
-            tier = "common"
-        else:
-            tier = "trivial"
-
-        # Suggest appropriate currency
-        if "DREAM+" in flags:
-            suggested_currency = SymbolicCurrency.DREAMPOINTS
-        elif "ECHO+" in flags or recursion_depth > 3:
-            suggested_currency = SymbolicCurrency.LOOPTOKENS
-        else:
-            suggested_currency = SymbolicCurrency.MIRRORCREDITS
+        recursion_multiplier = config["recursion_multiplier"]
+        base_cost = config["base_cost"]
+        value, tier, flag_bonus, suggested_currency = _compute_valuation(
+            charge,
+            recursion_depth,
+            _flag_set(invocation.flags),
+            recursion_multiplier,
+            base_cost,
+        )
 
         valuation = {
             "status": "valued",
@@ -193,51 +247,55 @@ class ChamberOfCommerce(OrganHandler):
             "value": value,
             "tier": tier,
             "components": {
-                "recursion_contribution": recursion_depth * config["recursion_multiplier"],
+                "recursion_contribution": recursion_depth * recursion_multiplier,
                 "charge_contribution": charge,
                 "flag_bonus": flag_bonus,
-                "base_cost": config["base_cost"],
+                "base_cost": base_cost,
             },
-            "suggested_currency": suggested_currency.value,
+            "suggested_currency": suggested_currency,
             "tradeable": value >= 20,
         }
 
         # Cache valuation
         if symbol:
-            self._valuation_cache[symbol[:50]] = valuation
+            self._valuation_cache[valuation["symbol"]] = valuation
 
         return valuation
 
     def _execute_trade(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Execute a symbolic trade between entities."""
         # Parse trade details from symbol: "FROM:TO:CURRENCY:AMOUNT"
-        parts = invocation.symbol.split(":")
-        if len(parts) < 4:
+        # partition() yields the four fields without building a list and stops
+        # at the first missing separator; fields past the fourth are ignored
+        from_part, sep1, rest = invocation.symbol.partition(":")
+        to_part, sep2, rest = rest.partition(":")
+        currency_part, sep3, rest = rest.partition(":")
+        if not (sep1 and sep2 and sep3):
             return {
                 "status": "failed",
                 "error": "Invalid trade format. Use FROM:TO:CURRENCY:AMOUNT",
                 "example": "SELF:ARCHIVE:looptokens:10",
             }
+        amount_part = rest.partition(":")[0]
 
-        from_entity = parts[0].strip().upper()
-        to_entity = parts[1].strip().upper()
-        currency_str = parts[2].strip().lower()
+        from_entity = from_part.strip().upper()
+        to_entity = to_part.strip().upper()
+        currency_str = currency_part.strip().lower()
         try:
-            amount = int(parts[3].strip())
+            amount = int(amount_part)
         except ValueError:
             return {
                 "status": "failed",
-                "error": f"Invalid amount: {parts[3]}",
+                "error": f"Invalid amount: {amount_part}",
             }
 
         # Validate currency
-        try:
-            currency = SymbolicCurrency(currency_str)
-        except ValueError:
+        currency = _CURRENCY_BY_NAME.get(currency_str)
+        if currency is None:
             return {
                 "status": "failed",
                 "error": f"Invalid currency: {currency_str}",
-                "valid_currencies": [c.value for c in SymbolicCurrency],
+                "valid_currencies": list(_ALL_CURRENCY_NAMES),
             }
 
         # Validate amount
@@ -272,7 +330,7 @@ class ChamberOfCommerce(OrganHandler):
             timestamp=datetime.now(),
             reason=f"Ritual trade at charge {invocation.charge}",
         )
-        self._trade_ledger.append(trade)
+        self._record_trade(trade)
 
         return {
             "status": "completed",
@@ -293,9 +351,10 @@ class ChamberOfCommerce(OrganHandler):
             }
 
         # Determine currency type from flags or default
-        if "DREAM+" in invocation.flags:
+        flag_set = _flag_set(invocation.flags)
+        if "DREAM+" in flag_set:
             currency = SymbolicCurrency.DREAMPOINTS
-        elif "ECHO+" in invocation.flags or "LAW_LOOP+" in invocation.flags:
+        elif "ECHO+" in flag_set or "LAW_LOOP+" in flag_set:
             currency = SymbolicCurrency.LOOPTOKENS
         else:
             currency = SymbolicCurrency.MIRRORCREDITS
@@ -306,7 +365,8 @@ class ChamberOfCommerce(OrganHandler):
         mint_amount = max(1, base_mint)
 
         # Check daily limit
-        today = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = self._day_key(now)
         daily_total = self._daily_minted.get(today, 0)
         if daily_total + mint_amount > VALUATION_CONFIG["max_daily_mint"]:
             available = VALUATION_CONFIG["max_daily_mint"] - daily_total
@@ -336,9 +396,9 @@ class ChamberOfCommerce(OrganHandler):
             recipient=recipient,
             source_ritual=f"charge_{invocation.charge}",
             charge_at_mint=invocation.charge,
-            timestamp=datetime.now(),
+            timestamp=now,
         )
-        self._mint_ledger.append(mint)
+        self._record_mint(mint)
 
         return {
             "status": "minted",
@@ -353,13 +413,15 @@ class ChamberOfCommerce(OrganHandler):
 
         # Filter trades
         if entity_filter:
+            trade_ledger = self._trade_ledger
+            mint_ledger = self._mint_ledger
             trades = [
-                t.to_dict() for t in self._trade_ledger
-                if t.from_entity == entity_filter or t.to_entity == entity_filter
+                trade_ledger[i].to_dict()
+                for i in self._trades_by_entity.get(entity_filter, ())
             ]
             mints = [
-                m.to_dict() for m in self._mint_ledger
-                if m.recipient == entity_filter
+                mint_ledger[i].to_dict()
+                for i in self._mints_by_recipient.get(entity_filter, ())
             ]
         else:
             trades = [t.to_dict() for t in self._trade_ledger[-50:]]  # Last 50
@@ -383,11 +445,8 @@ class ChamberOfCommerce(OrganHandler):
         return {
             "status": "balance_retrieved",
             "entity": entity,
-            "balances": {
-                currency.value: balances.get(currency.value, 0)
-                for currency in SymbolicCurrency
-            },
-            "total_value": sum(balances.values()),
+            "balances": {name: balances.get(name, 0) for name in _ALL_CURRENCY_NAMES},
+            "total_value": self._entity_totals.get(entity, 0),
         }
 
     def _default_economy(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
@@ -395,41 +454,76 @@ class ChamberOfCommerce(OrganHandler):
         total_trades = len(self._trade_ledger)
         total_mints = len(self._mint_ledger)
 
-        # Calculate total currency in circulation
-        circulation = {currency.value: 0 for currency in SymbolicCurrency}
-        for entity_balances in self._balances.values():
-            for currency, amount in entity_balances.items():
-                circulation[currency] = circulation.get(currency, 0) + amount
-
         return {
             "status": "economy_status",
             "total_trades": total_trades,
             "total_mints": total_mints,
             "entities_count": len(self._balances),
-            "currency_in_circulation": circulation,
-            "today_minted": self._daily_minted.get(datetime.now().strftime("%Y-%m-%d"), 0),
+            "currency_in_circulation": dict(self._circulation),
+            "today_minted": self._daily_minted.get(self._day_key(datetime.now()), 0),
             "valuation_config": VALUATION_CONFIG,
         }
 
+    def _record_trade(self, trade: TradeRecord) -> None:
+        """Append a trade to the ledger and index it under both parties."""
+        index = len(self._trade_ledger)
+        self._trade_ledger.append(trade)
+        self._trades_by_entity.setdefault(trade.from_entity, []).append(index)
+        if trade.to_entity != trade.from_entity:
+            self._trades_by_entity.setdefault(trade.to_entity, []).append(index)
+
+    def _record_mint(self, mint: MintRecord) -> None:
+        """Append a mint to the ledger and index it under its recipient."""
+        self._mints_by_recipient.setdefault(mint.recipient, []).append(len(self._mint_ledger))
+        self._mint_ledger.append(mint)
+
+    def _day_key(self, moment: datetime) -> str:
+        """Get the YYYY-MM-DD daily-mint key, formatted once per day."""
+        day = moment.date()
+        if day != self._day_cache:
+            self._day_cache = day
+            self._day_key_cache = day.isoformat()
+        return self._day_key_cache
+
+    def _count_circulation(self) -> Dict[str, int]:
+        """Sum every entity's balances into per-currency circulation totals."""
+        circulation = {currency.value: 0 for currency in SymbolicCurrency}
+        for entity_balances in self._balances.values():
+            for currency, amount in entity_balances.items():
+                circulation[currency] = circulation.get(currency, 0) + amount
+        return circulation
+
+    def _count_entity_totals(self) -> Dict[str, int]:
+        """Sum each entity's balances across currencies."""
+        return {
+            entity: sum(entity_balances.values())
+            for entity, entity_balances in self._balances.items()
+        }
+
     def _get_balance(self, entity: str, currency: SymbolicCurrency) -> int:
         """Get balance for entity and currency."""
-        if entity not in self._balances:
+        balances = self._balances.get(entity)
+        if balances is None:
             return 0
-        return self._balances[entity].get(currency.value, 0)
+        return balances.get(currency.value, 0)
 
     def _credit(self, entity: str, currency: SymbolicCurrency, amount: int) -> None:
         """Credit amount to entity."""
-        if entity not in self._balances:
-            self._balances[entity] = {}
-        current = self._balances[entity].get(currency.value, 0)
-        self._balances[entity][currency.value] = current + amount
+        balances = self._balances.setdefault(entity, {})
+        key = currency.value
+        balances[key] = balances.get(key, 0) + amount
+        self._circulation[key] += amount
+        self._entity_totals[entity] = self._entity_totals.get(entity, 0) + amount
 
     def _debit(self, entity: str, currency: SymbolicCurrency, amount: int) -> None:
         """Debit amount from entity."""
-        if entity not in self._balances:
-            self._balances[entity] = {}
-        current = self._balances[entity].get(currency.value, 0)
-        self._balances[entity][currency.value] = max(0, current - amount)
+        balances = self._balances.setdefault(entity, {})
+        key = currency.value
+        current = balances.get(key, 0)
+        balances[key] = max(0, current - amount)
+        removed = min(current, amount)
+        self._circulation[key] -= removed
+        self._entity_totals[entity] = self._entity_totals.get(entity, 0) - removed
 
     def grant_balance(self, entity: str, currency: SymbolicCurrency, amount: int) -> Dict[str, Any]:
         """Grant balance directly (for testing/admin)."""
@@ -464,6 +558,8 @@ class ChamberOfCommerce(OrganHandler):
         super().restore_state(state)
         inner_state = state.get("state", {})
         self._balances = inner_state.get("balances", {})
+        self._circulation = self._count_circulation()
+        self._entity_totals = self._count_entity_totals()
         self._daily_minted = inner_state.get("daily_minted", {})
         # Note: ledger restoration would require TradeRecord/MintRecord deserialization
 
@@ -471,7 +567,11 @@ class ChamberOfCommerce(OrganHandler):
         """Reset organ to initial state."""
         super().reset()
         self._balances = {}
+        self._circulation = self._count_circulation()
+        self._entity_totals = self._count_entity_totals()
         self._trade_ledger = []
         self._mint_ledger = []
+        self._trades_by_entity = {}
+        self._mints_by_recipient = {}
         self._daily_minted = {}
         self._valuation_cache = {}
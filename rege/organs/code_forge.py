@@ -9,13 +9,45 @@ The Code Forge governs:
 - Code generation in Python, Max/MSP, JSON
 """
 
-from typing import List, Dict, Any
+from typing import Any, Dict, List
 import json
 
 from rege.organs.base import OrganHandler
 from rege.core.models import Invocation, Patch
 
 
+# Charge-tier branches shared by every generated decision tree; read-only
+_DECISION_BRANCHES = (
+    {
+        "condition": "charge >= 86",
+        "action": "escalate_to_ritual_court",
+        "label": "CRITICAL",
+    },
+    {
+        "condition": "charge >= 71",
+        "action": "deep_processing",
+        "label": "INTENSE",
+    },
+    {
+        "condition": "charge >= 51",
+        "action": "standard_processing",
+        "label": "ACTIVE",
+    },
+    {
+        "condition": "default",
+        "action": "archive_and_monitor",
+        "label": "BACKGROUND",
+    },
+)
+
+# Rules shared by every generated simulation; read-only
+_SIMULATION_RULES = (
+    "charge decays over time unless reinforced",
+    "high charge triggers ritual events",
+    "critical charge spawns new symbols",
+)
+
+
 class CodeForge(OrganHandler):
     """
     The Code Forge - Symbol-to-code translation engine.
@@ -29,6 +61,17 @@ class CodeForge(OrganHandler):
     - default: Auto-detect best mode
     """
 
+    __slots__ = ()
+
+    # Mode -> handler method name; unknown modes use _default_mode
+    _MODE_HANDLERS: Dict[str, str] = {
+        "func_mode": "_func_mode",
+        "class_mode": "_class_mode",
+        "wave_mode": "_wave_mode",
+        "tree_mode": "_tree_mode",
+        "sim_mode": "_sim_mode",
+    }
+
     @property
     def name(self) -> str:
         return "CODE_FORGE"
@@ -39,20 +82,8 @@ class CodeForge(OrganHandler):
 
     def invoke(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Process invocation through Code Forge."""
-        mode = invocation.mode.lower()
-
-        if mode == "func_mode":
-            return self._func_mode(invocation, patch)
-        elif mode == "class_mode":
-            return self._class_mode(invocation, patch)
-        elif mode == "wave_mode":
-            return self._wave_mode(invocation, patch)
-        elif mode == "tree_mode":
-            return self._tree_mode(invocation, patch)
-        elif mode == "sim_mode":
-            return self._sim_mode(invocation, patch)
-        else:
-            return self._default_mode(invocation, patch)
+        handler = self._MODE_HANDLERS.get(invocation.mode.lower(), "_default_mode")
+        return getattr(self, handler)(invocation, patch)
 
     def _func_mode(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
         """Translate to Python function."""
@@ -222,28 +253,7 @@ class CodeForge(OrganHandler):
                 "question": f"Regarding: {symbol[:50]}",
                 "condition": "charge_level",
             },
-            "branches": [
-                {
-                    "condition": "charge >= 86",
-                    "action": "escalate_to_ritual_court",
-                    "label": "CRITICAL",
-                },
-                {
-                    "condition": "charge >= 71",
-                    "action": "deep_processing",
-                    "label": "INTENSE",
-                },
-                {
-                    "condition": "charge >= 51",
-                    "action": "standard_processing",
-                    "label": "ACTIVE",
-                },
-                {
-                    "condition": "default",
-                    "action": "archive_and_monitor",
-                    "label": "BACKGROUND",
-                },
-            ],
+            "branches": _DECISION_BRANCHES,
         }
 
     def _generate_simulation(self, symbol: str, charge: int) -> Dict[str, Any]:
@@ -260,11 +270,7 @@ class CodeForge(OrganHandler):
                 {"type": "symbol", "properties": {"content": symbol[:30]}},
                 {"type": "observer", "properties": {"charge_threshold": 50}},
             ],
-            "rules": [
-                "charge decays over time unless reinforced",
-                "high charge triggers ritual events",
-                "critical charge spawns new symbols",
-            ],
+            "rules": _SIMULATION_RULES,
         }
 
     def get_valid_modes(self) -> List[str]:
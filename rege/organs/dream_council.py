@@ -19,6 +19,16 @@ from rege.core.models import Invocation, Patch, LawProposal
 from rege.core.constants import get_tier
 
 
+# Emotion keywords, in the order emotions are reported
+_EMOTION_KEYWORDS = (
+    ("fear", ("afraid", "scared", "fear", "terror")),
+    ("grief", ("sad", "loss", "grief", "gone")),
+    ("joy", ("happy", "joy", "light", "peace")),
+    ("anger", ("angry", "rage", "furious")),
+    ("love", ("love", "heart", "embrace")),
+)
+
+
 class Dream:
     """A dream record."""
 
@@ -245,17 +255,12 @@ class DreamCouncil(OrganHandler):
 
     def _analyze_emotional_layer(self, dream: Dream) -> Dict[str, Any]:
         """Analyze the emotional layer of the dream."""
-        content_lower = dream.content.lower()
-
-        emotions = {
-            "fear": any(w in content_lower for w in ["afraid", "scared", "fear", "terror"]),
-            "grief": any(w in content_lower for w in ["sad", "loss", "grief", "gone"]),
-            "joy": any(w in content_lower for w in ["happy", "joy", "light", "peace"]),
-            "anger": any(w in content_lower for w in ["angry", "rage", "furious"]),
-            "love": any(w in content_lower for w in ["love", "heart", "embrace"]),
-        }
+        contains = dream.content.lower().__contains__
 
-        detected = [e for e, present in emotions.items() if present]
+        detected = [
+            emotion for emotion, keywords in _EMOTION_KEYWORDS
+            if any(map(contains, keywords))
+        ]
 
         return {
             "detected_emotions": detected or ["complex/undefined"],
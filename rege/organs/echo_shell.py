@@ -113,7 +113,7 @@ class EchoShell(OrganHandler):
     def __init__(self):
         super().__init__()
         self._echoes: Dict[str, Echo] = {}
-        self._latent_pool: List[str] = []  # IDs of LATENT echoes
+        self._latent_pool: Dict[str, None] = {}  # IDs of LATENT echoes, in entry order
         self._depth_log: List[Dict] = []
 
     def invoke(self, invocation: Invocation, patch: Patch) -> Dict[str, Any]:
@@ -302,11 +302,9 @@ class EchoShell(OrganHandler):
     def _update_latent_pool(self, echo: Echo) -> None:
         """Update latent pool membership for echo."""
         if echo.charge <= TIER_BOUNDARIES["LATENT_MAX"]:
-            if echo.echo_id not in self._latent_pool:
-                self._latent_pool.append(echo.echo_id)
+            self._latent_pool.setdefault(echo.echo_id)
         else:
-            if echo.echo_id in self._latent_pool:
-                self._latent_pool.remove(echo.echo_id)
+            self._latent_pool.pop(echo.echo_id, None)
 
     def _echo_recommendations(self, echo: Echo) -> List[str]:
         """Generate recommendations for echo."""
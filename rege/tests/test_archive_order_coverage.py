@@ -10,6 +10,9 @@ Targets:
 - State persistence edge cases
 """
 
+import copy
+import pickle
+
 import pytest
 from datetime import datetime, timedelta
 
@@ -61,6 +64,20 @@ class TestDecayMechanics:
         # At 0-25 (LATENT), decay rate should be 0.2 (fast decay)
         assert node.decay_rate == 0.2
 
+    def test_tier_follows_charge_changes(self):
+        """Test cached tier is refreshed when charge changes."""
+        node = MemoryNode(content="Tier test", charge=50, tags=[])
+        assert node.tier == "PROCESSING"
+
+        node.access()
+        assert node.tier == "ACTIVE"
+
+        node.apply_decay(days_elapsed=10)
+        assert node.tier == "PROCESSING"
+
+        node.charge = 90
+        assert node.tier == "CRITICAL"
+
     def test_apply_decay_with_zero_days(self):
         """Test apply_decay with days_elapsed=0."""
         node = MemoryNode(content="No decay test", charge=80, tags=[])
@@ -198,6 +215,53 @@ class TestSearchAndRetrieval:
 
         assert len(results) >= 1
 
+    def test_search_follows_tag_and_content_updates(self):
+        """Test search sees tags and content changed after creation."""
+        node = self.archive.create_memory_node("Original words", 50, [])
+
+        node.add_tag("Late_Tag+")
+        assert self.archive._search_nodes("late_tag") == [node]
+
+        node.tags = ["REPLACED+"]
+        assert self.archive._search_nodes("late_tag") == []
+        assert self.archive._search_nodes("replaced") == [node]
+
+        node.content = "Rewritten Words"
+        assert self.archive._search_nodes("original") == []
+        assert self.archive._search_nodes("rewritten") == [node]
+
+    def test_tags_stay_a_list(self):
+        """Test tags remain a list owned by the node."""
+        flags = ["FIRST+"]
+        node = self.archive.create_memory_node("Tagged", 50, flags)
+
+        node.tags.append("X")
+        assert flags == ["FIRST+"]
+        assert node.to_dict()["tags"] == ["FIRST+", "X"]
+        assert self.archive._search_nodes("x") == [node]
+
+    def test_search_matches_full_scan(self):
+        """Test search agrees with a plain substring scan."""
+        contents = ["The river remembers", "Mirror of rivers", "ember glow", "Riverbed"]
+        for i, content in enumerate(contents):
+            self.archive.create_memory_node(content, 50, [f"TAG_{i}+"])
+
+        for query in ["river", "EMBER", "rs r", "tag_2", "ri", "xyz", "glow!"]:
+            expected = [
+                n for n in self.archive.get_all_nodes()
+                if query.lower() in n.content.lower()
+                or any(query.lower() in t.lower() for t in n.tags)
+            ]
+            assert self.archive._search_nodes(query) == expected
+
+    def test_search_does_not_match_across_texts(self):
+        """Test a query cannot span the boundary between content and a tag."""
+        self.archive.create_memory_node("alpha", 50, ["beta"])
+
+        assert self.archive._search_nodes("a\x00b") == []
+        assert self.archive._search_nodes("ab") == []
+        assert len(self.archive._search_nodes("ph")) == 1
+
 
 class TestVersionConsolidation:
     """Tests for version tracking and consolidation."""
@@ -331,7 +395,14 @@ class TestThreadTagging:
         self.archive._index_by_thread(tag, node.node_id)
 
         # Should only appear once
-        assert self.archive._thread_tags[tag].count(node.node_id) == 1
+        assert self.archive._thread_tags[tag] == {node.node_id}
+
+    def test_duplicate_tags_indexed_once(self):
+        """Test repeated tags on a node are indexed a single time."""
+        node = self.archive.create_memory_node("Dup tags", 50, ["ECHO+", "ECHO+", "CANON+"])
+
+        assert self.archive._thread_tags["ECHO+"] == {node.node_id}
+        assert self.archive._thread_tags["CANON+"] == {node.node_id}
 
 
 class TestRecommendations:
@@ -415,6 +486,81 @@ class TestStatePersistence:
         # Charge should be capped at 100
         assert node.charge <= 100
 
+    def test_access_with_shared_timestamp(self):
+        """Test access accepts a caller-supplied timestamp."""
+        node = MemoryNode(content="Timed memory", charge=50, tags=[])
+        moment = datetime(2024, 5, 1, 12, 0, 0)
+
+        node.access(moment)
+
+        assert node.last_accessed == moment
+        assert node.access_count == 1
+
+    def test_to_dict_reflects_mutation(self):
+        """Test to_dict output is independent and reflects later node changes."""
+        node = MemoryNode(content="Some memory", charge=50, tags=[])
+        first = node.to_dict()
+
+        first["charge"] = 0
+        assert node.to_dict()["charge"] == 50
+
+        node.access()
+        node.version = 3
+        node.add_tag("LATE+")
+        data = node.to_dict()
+
+        assert data["charge"] == 51
+        assert data["access_count"] == 1
+        assert data["version"] == 3
+        assert data["tags"] == ["LATE+"]
+
+    def test_to_dict_tracks_every_field(self):
+        """Test to_dict reflects each field assigned after a previous call."""
+        node = MemoryNode(content="Original memory", charge=50, tags=[])
+        node.to_dict()
+
+        node.node_id = "MEM_RENAMED"
+        node.content = "Edited memory"
+        node.created_at = datetime(2001, 1, 1)
+        node.last_accessed = datetime(2002, 1, 1)
+        node.tags.append("INPLACE+")
+        node.linked_nodes.append("MEM_OTHER")
+        node.access_count = 7
+        data = node.to_dict()
+
+        assert data["node_id"] == "MEM_RENAMED"
+        assert data["content"] == "Edited memory"
+        assert data["created_at"] == "2001-01-01T00:00:00"
+        assert data["last_accessed"] == "2002-01-01T00:00:00"
+        assert data["tags"] == ["INPLACE+"]
+        assert data["linked_nodes"] == ["MEM_OTHER"]
+        assert data["access_count"] == 7
+
+    def test_memory_node_is_slotted(self):
+        """Test MemoryNode stores attributes in slots, not a __dict__."""
+        node = MemoryNode(content="Slotted memory", charge=50, tags=[])
+
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.unexpected_attribute = True
+
+    def test_archived_node_copies_without_its_archive(self):
+        """Test copying an archived node does not copy the archive."""
+        node = self.archive.create_memory_node("Portable memory", 50, ["KEEP+"])
+        for i in range(50):
+            self.archive.create_memory_node(f"Other memory {i}", 50, [])
+
+        clone = copy.deepcopy(node)
+        payload = pickle.dumps(node)
+        restored = pickle.loads(payload)
+
+        # Only this node's fields, none of the other archived nodes
+        assert b"Other memory" not in payload
+
+        assert clone.to_dict() == node.to_dict()
+        assert restored.to_dict() == node.to_dict()
+        assert len(self.archive.get_all_nodes()) == 51
+
     def test_linked_nodes_with_many_links(self):
         """Test linked_nodes with many connections."""
         node = MemoryNode(content="Connected memory", charge=50, tags=[])
@@ -584,6 +730,44 @@ class TestDecayCheckMethod:
         assert result["at_risk"] is True
 
 
+class TestDecayIndexes:
+    """Tests for latent and decaying node lookups after node changes."""
+
+    def setup_method(self):
+        """Set up test archive."""
+        self.archive = ArchiveOrder()
+
+    def test_latent_index_follows_charge_changes(self):
+        """Test latent nodes track charge updates in creation order."""
+        first = self.archive.create_memory_node("First", 20, [])
+        second = self.archive.create_memory_node("Second", 60, [])
+        third = self.archive.create_memory_node("Third", 10, [])
+
+        assert self.archive._get_latent_nodes() == [first, third]
+
+        second.charge = 5
+        first.charge = 40
+        assert self.archive._get_latent_nodes() == [second, third]
+
+    def test_decaying_index_follows_access_changes(self):
+        """Test decaying nodes track last-access updates."""
+        old = self.archive.create_memory_node("Old", 60, [])
+        older = self.archive.create_memory_node("Older", 40, [])
+        fresh = self.archive.create_memory_node("Fresh", 30, [])
+        empty = self.archive.create_memory_node("Empty", 0, [])
+
+        old.last_accessed = datetime.now() - timedelta(days=8)
+        older.last_accessed = datetime.now() - timedelta(days=30)
+        empty.last_accessed = datetime.now() - timedelta(days=30)
+
+        # Sorted by charge, zero-charge nodes excluded
+        assert self.archive._get_decaying_nodes() == [older, old]
+
+        older.access()
+        assert self.archive._get_decaying_nodes() == [old]
+        assert fresh not in self.archive._get_decaying_nodes()
+
+
 class TestHelperMethods:
     """Tests for helper methods."""
 
@@ -601,16 +785,26 @@ class TestHelperMethods:
         # All should produce same hash
         assert hash1 == hash2 == hash3
 
-    def test_content_hash_truncation(self):
-        """Test content hash truncates at 50 characters."""
+    def test_content_hash_uses_full_content(self):
+        """Test content sharing a long prefix hashes differently."""
         long_content = "A" * 100 + "_unique_suffix"
         short_content = "A" * 50
 
         hash_long = self.archive._content_hash(long_content)
         hash_short = self.archive._content_hash(short_content)
 
-        # Both should hash to same (first 50 chars)
-        assert hash_long == hash_short
+        assert hash_long != hash_short
+        assert len(hash_long) == len(hash_short) == 16
+
+    def test_shared_prefix_is_not_a_version(self):
+        """Test distinct content with a common prefix starts a new version line."""
+        prefix = "Shared opening line of a long memory " * 3
+        node1 = self.archive.create_memory_node(prefix + "ending one", 50, [])
+        node2 = self.archive.create_memory_node(prefix + "ending two", 50, [])
+
+        assert node1.version == 1
+        assert node2.version == 1
+        assert node2.linked_nodes == []
 
     def test_get_valid_modes(self):
         """Test get_valid_modes returns expected modes."""
@@ -621,6 +815,12 @@ class TestHelperMethods:
         assert "decay_check" in modes
         assert "default" in modes
 
+    def test_mode_handlers_name_valid_modes(self):
+        """Test the class-level mode table names real handlers for valid modes."""
+        for mode, handler in ArchiveOrder._MODE_HANDLERS.items():
+            assert mode in self.archive.get_valid_modes()
+            assert callable(getattr(self.archive, handler))
+
     def test_get_output_types(self):
         """Test get_output_types returns expected types."""
         types = self.archive.get_output_types()
@@ -2,6 +2,13 @@
 Tests for Blockchain Economy organ.
 """
 
+import copy
+import dataclasses
+import hashlib
+import json
+import pickle
+import sys
+
 import pytest
 from rege.organs.blockchain_economy import (
     BlockchainEconomy,
@@ -76,6 +83,135 @@ class TestMythBlock:
         assert data["contributor"] == "SERIALIZER"
         assert "hash" in data
 
+    def test_myth_block_to_dict_tracks_changes(self):
+        """Test to_dict returns independent dicts reflecting rebound fields."""
+        block = MythBlock(
+            block_id="CACHE",
+            previous_hash="prev",
+            timestamp=datetime(2024, 1, 1),
+            contributor="CACHER",
+            charge=40,
+            ritual_data={"k": "v"},
+        )
+        first = block.to_dict()
+        first["charge"] = 0
+
+        assert block.to_dict()["charge"] == 40
+        assert block.to_dict() is not block.to_dict()
+
+        block.charge = 41
+        assert block.to_dict()["charge"] == 41
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10")
+    def test_myth_block_and_contract_are_slotted(self):
+        """Test blocks and contracts carry no per-instance __dict__."""
+        block = MythBlock(
+            block_id="SLOTS",
+            previous_hash="prev",
+            timestamp=datetime(2024, 1, 1),
+            contributor="SLOTTED",
+            charge=50,
+            ritual_data={},
+        )
+        contract = RitualContract(
+            contract_id="SLOTS",
+            creator="SLOTTED",
+            promise="Promise",
+            delivery_condition="Condition",
+            charge_requirement=50,
+            created_at=datetime(2024, 1, 1),
+        )
+
+        assert not hasattr(block, "__dict__")
+        assert not hasattr(contract, "__dict__")
+        assert block.hash == block._calculate_hash()
+
+    def test_myth_block_hash_matches_canonical_json(self):
+        """Test cached envelope hashes the same bytes as a full json.dumps."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        block = MythBlock(
+            block_id="CANONICAL",
+            previous_hash="prev",
+            timestamp=timestamp,
+            contributor="CANON",
+            charge=70,
+            ritual_data={"b": [1, 2], "a": {"nested": "ritual_data"}},
+            nonce=3,
+        )
+
+        expected = hashlib.sha256(json.dumps({
+            "block_id": "CANONICAL",
+            "previous_hash": "prev",
+            "timestamp": timestamp.isoformat(),
+            "contributor": "CANON",
+            "charge": 70,
+            "ritual_data": {"b": [1, 2], "a": {"nested": "ritual_data"}},
+            "nonce": 3,
+        }, sort_keys=True).encode()).hexdigest()
+        assert block.hash == expected
+
+    def test_myth_block_hash_escapes_envelope_strings(self):
+        """Test envelope strings are escaped exactly like json.dumps."""
+        timestamp = datetime(2024, 1, 1)
+        fields = {
+            "block_id": 'QUOTE"ID',
+            "previous_hash": "back\\slash",
+            "timestamp": timestamp.isoformat(),
+            "contributor": "ÉCHO\n",
+            "charge": 0,
+            "ritual_data": {},
+            "nonce": -1,
+        }
+        block = MythBlock(
+            block_id=fields["block_id"],
+            previous_hash=fields["previous_hash"],
+            timestamp=timestamp,
+            contributor=fields["contributor"],
+            charge=0,
+            ritual_data={},
+            nonce=-1,
+        )
+
+        expected = hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+        assert block.hash == expected
+
+    def test_myth_block_copies_pickles_and_converts(self):
+        """Test hashed blocks stay plain dataclasses that copy, pickle and asdict."""
+        block = MythBlock(
+            block_id="PICKLE",
+            previous_hash="prev",
+            timestamp=datetime(2024, 1, 1),
+            contributor="PICKLER",
+            charge=50,
+            ritual_data={"k": "v"},
+        )
+        block.to_dict()
+
+        for clone in (copy.deepcopy(block), pickle.loads(pickle.dumps(block))):
+            assert clone == block
+            assert clone._calculate_hash() == block.hash
+            assert clone.to_dict() == block.to_dict()
+        assert dataclasses.asdict(block)["hash"] == block.hash
+
+    def test_myth_block_hash_tracks_changes(self):
+        """Test rebinding fields or mutating ritual_data changes the hash."""
+        block = MythBlock(
+            block_id="CHANGES",
+            previous_hash="prev",
+            timestamp=datetime(2024, 1, 1),
+            contributor="CHANGER",
+            charge=50,
+            ritual_data={"key": "value"},
+        )
+        original = block._calculate_hash()
+
+        block.charge = 51
+        rebound = block._calculate_hash()
+        assert rebound != original
+
+        block.ritual_data["key"] = "other"
+        assert block._calculate_hash() != rebound
+
 
 class TestRitualContract:
     """Tests for RitualContract data class."""
@@ -125,6 +261,27 @@ class TestRitualContract:
         assert data["contract_id"] == "SERIALIZE"
         assert len(data["witnesses"]) == 2
 
+    def test_ritual_contract_to_dict_tracks_status(self):
+        """Test contract dict reflects status changes."""
+        contract = RitualContract(
+            contract_id="CACHED",
+            creator="CREATOR",
+            promise="Promise",
+            delivery_condition="Condition",
+            charge_requirement=60,
+            created_at=datetime.now(),
+        )
+        first = contract.to_dict()
+        first["status"] = "mutated"
+
+        assert contract.to_dict()["status"] == "pending"
+
+        contract.status = "fulfilled"
+        contract.fulfilled_at = datetime(2024, 1, 1)
+        data = contract.to_dict()
+        assert data["status"] == "fulfilled"
+        assert data["fulfilled_at"] == "2024-01-01T00:00:00"
+
 
 class TestBlockchainEconomy:
     """Tests for BlockchainEconomy organ."""
@@ -276,6 +433,119 @@ class TestBlockchainEconomy:
         assert not result["is_valid"]
         assert len(result["errors"]) > 0
 
+    def test_mint_block_shares_one_timestamp(self):
+        """Test ritual_data and block carry the same timestamp."""
+        patch = Patch(input_node="test", output_node="BLOCKCHAIN_ECONOMY", tags=[], charge=60)
+        result = self.organ.invoke(Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="STAMP",
+            mode="mint",
+            depth=DepthLevel.STANDARD,
+            expect="block",
+            charge=60,
+        ), patch)
+        block = result["block"]
+
+        assert block["ritual_data"]["timestamp"] == block["timestamp"]
+        stats = self.organ._contributors["STAMP"]
+        assert stats["first_contribution"] == block["timestamp"]
+
+    def test_default_chain_counts_active_contracts(self):
+        """Test chain status tracks pending contracts through fulfillment."""
+        patch = Patch(input_node="test", output_node="BLOCKCHAIN_ECONOMY", tags=[], charge=80)
+        status_inv = Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="",
+            mode="default",
+            depth=DepthLevel.STANDARD,
+            expect="chain_status",
+            charge=50,
+        )
+        contract_ids = []
+        for promise in ("First|Done|60", "Second|Done|60"):
+            result = self.organ.invoke(Invocation(
+                organ="BLOCKCHAIN_ECONOMY",
+                symbol=promise,
+                mode="contract",
+                depth=DepthLevel.STANDARD,
+                expect="contract",
+                charge=60,
+            ), patch)
+            contract_ids.append(result["contract"]["contract_id"])
+
+        assert self.organ.invoke(status_inv, patch)["active_contracts"] == 2
+
+        self.organ.invoke(Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol=contract_ids[0],
+            mode="contract",
+            depth=DepthLevel.STANDARD,
+            expect="contract",
+            charge=80,
+            flags=["FULFILL+"],
+        ), patch)
+        status = self.organ.invoke(status_inv, patch)
+
+        assert status["active_contracts"] == 1
+        assert status["total_contracts"] == 2
+        assert self.organ._contract_status_counts == {"pending": 1, "fulfilled": 1}
+
+    def test_verify_chain_detects_rehash_after_edit(self):
+        """Test editing and rehashing a block breaks the next block's link."""
+        patch = Patch(input_node="test", output_node="BLOCKCHAIN_ECONOMY", tags=[], charge=60)
+        mint_inv = Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="REHASH",
+            mode="mint",
+            depth=DepthLevel.STANDARD,
+            expect="block",
+            charge=60,
+        )
+        self.organ.invoke(mint_inv, patch)
+        self.organ.invoke(mint_inv, patch)
+
+        block = self.organ._chain[1]
+        block.ritual_data["edited"] = True
+        block.hash = block._calculate_hash()
+        result = self.organ.invoke(Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="",
+            mode="verify",
+            depth=DepthLevel.STANDARD,
+            expect="verification_result",
+            charge=50,
+        ), patch)
+
+        assert not result["is_valid"]
+        assert result["errors"] == [f"Block 2 hash mismatch: expected {block.hash[:16]}..."]
+
+    def test_verify_chain_detects_tampering_after_clean_verify(self):
+        """Test every verify re-checks blocks covered by an earlier verification."""
+        patch = Patch(input_node="test", output_node="BLOCKCHAIN_ECONOMY", tags=[], charge=60)
+        self.organ.invoke(Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="RECHECK",
+            mode="mint",
+            depth=DepthLevel.STANDARD,
+            expect="block",
+            charge=60,
+        ), patch)
+        verify_inv = Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="",
+            mode="verify",
+            depth=DepthLevel.STANDARD,
+            expect="verification_result",
+            charge=50,
+        )
+        assert self.organ.invoke(verify_inv, patch)["is_valid"]
+
+        self.organ._chain[1].ritual_data["tampered"] = True
+        result = self.organ.invoke(verify_inv, patch)
+
+        assert not result["is_valid"]
+        assert "Block 1 integrity violated" in result["errors"]
+
     def test_create_contract(self):
         """Test creating a ritual contract."""
         invocation = Invocation(
@@ -531,6 +801,33 @@ class TestBlockchainEconomy:
 
         assert result["status"] == "history_retrieved"
         assert result["returned_count"] == 2  # ALICE has 2 blocks
+        assert [b["contributor"] for b in result["blocks"]] == ["ALICE", "ALICE"]
+
+    def test_query_history_filter_matches_ritual_data(self):
+        """Test a filter that is not a contributor falls back to ritual_data."""
+        patch = Patch(input_node="test", output_node="BLOCKCHAIN_ECONOMY", tags=[], charge=60)
+        create_result = self.organ.invoke(Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol="Indexed promise|Condition|60",
+            mode="contract",
+            depth=DepthLevel.STANDARD,
+            expect="contract",
+            charge=60,
+        ), patch)
+        contract_id = create_result["contract"]["contract_id"]
+
+        result = self.organ.invoke(Invocation(
+            organ="BLOCKCHAIN_ECONOMY",
+            symbol=contract_id,
+            mode="history",
+            depth=DepthLevel.STANDARD,
+            expect="history",
+            charge=50,
+        ), patch)
+
+        assert result["returned_count"] == 1
+        assert result["blocks"][0]["ritual_data"]["contract_id"] == contract_id
+        assert self.organ._blocks_by_contributor["SELF"] == [1]
 
     def test_get_contributors_all(self):
         """Test getting all contributor stats."""
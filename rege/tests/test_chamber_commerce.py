@@ -2,6 +2,8 @@
 Tests for Chamber of Commerce organ.
 """
 
+import sys
+
 import pytest
 from rege.organs.chamber_commerce import (
     ChamberOfCommerce,
@@ -61,6 +63,28 @@ class TestTradeRecord:
 
         assert trade.trade_id.startswith("TRADE_")
 
+    def test_auto_ids_are_random_hex_suffixes(self):
+        """Test auto IDs carry 8 uppercase hex digits and do not repeat."""
+        ids = [
+            TradeRecord(
+                trade_id="",
+                from_entity="A",
+                to_entity="B",
+                currency=SymbolicCurrency.DREAMPOINTS,
+                amount=1,
+                charge_at_trade=50,
+                timestamp=datetime.now(),
+            ).trade_id
+            for _ in range(200)
+        ]
+
+        assert len(set(ids)) == len(ids)
+        for trade_id in ids:
+            suffix = trade_id[len("TRADE_"):]
+            assert len(suffix) == 8
+            assert suffix == suffix.upper()
+            int(suffix, 16)
+
     def test_trade_record_to_dict(self):
         """Test serializing trade record."""
         trade = TradeRecord(
@@ -112,6 +136,48 @@ class TestMintRecord:
 
         assert mint.mint_id.startswith("MINT_")
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10")
+    def test_records_are_slotted(self):
+        """Test ledger records carry no per-instance __dict__."""
+        trade = TradeRecord(
+            trade_id="",
+            from_entity="A",
+            to_entity="B",
+            currency=SymbolicCurrency.DREAMPOINTS,
+            amount=5,
+            charge_at_trade=50,
+            timestamp=datetime.now(),
+        )
+        mint = MintRecord(
+            mint_id="",
+            currency=SymbolicCurrency.LOOPTOKENS,
+            amount=5,
+            recipient="TEST",
+            source_ritual="auto",
+            charge_at_mint=60,
+            timestamp=datetime.now(),
+        )
+
+        assert not hasattr(trade, "__dict__")
+        assert not hasattr(mint, "__dict__")
+
+    def test_generated_ids_keep_format(self):
+        """Test generated IDs are a prefix plus 8 uppercase hex digits."""
+        mint = MintRecord(
+            mint_id="",
+            currency=SymbolicCurrency.LOOPTOKENS,
+            amount=5,
+            recipient="TEST",
+            source_ritual="auto",
+            charge_at_mint=60,
+            timestamp=datetime.now(),
+        )
+
+        suffix = mint.mint_id[len("MINT_"):]
+        assert len(suffix) == 8
+        assert suffix == suffix.upper()
+        int(suffix, 16)
+
 
 class TestChamberOfCommerce:
     """Tests for ChamberOfCommerce organ."""
@@ -172,6 +238,24 @@ class TestChamberOfCommerce:
 
         assert result["components"]["flag_bonus"] == 10  # 5 per flag
 
+    def test_assess_value_flag_bonus_ignores_case_and_other_flags(self):
+        """Test value flags match case-insensitively and others add nothing."""
+        invocation = Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="mixed flags",
+            mode="value",
+            depth=DepthLevel.STANDARD,
+            expect="valuation",
+            charge=70,
+            flags=["canon+", "Fuse+", "CANON+", "dream+"],
+        )
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=70)
+
+        result = self.organ.invoke(invocation, patch)
+
+        assert result["components"]["flag_bonus"] == 10  # repeated CANON+ counts once
+        assert result["suggested_currency"] == "dreampoints"
+
     def test_assess_value_legendary_tier(self):
         """Test legendary tier valuation."""
         invocation = Invocation(
@@ -208,6 +292,29 @@ class TestChamberOfCommerce:
         assert result["tier"] == "trivial"
         assert not result["tradeable"]
 
+    def test_assess_value_tier_boundaries(self):
+        """Test each value tier starts exactly at its threshold."""
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=50)
+        expected = {
+            19: "trivial", 20: "common", 39: "common", 40: "uncommon",
+            59: "uncommon", 60: "rare", 79: "rare", 80: "legendary",
+        }
+
+        for value, tier in expected.items():
+            # value = (depth + 1) * 2 + charge - 10 with patch depth 0
+            invocation = Invocation(
+                organ="CHAMBER_OF_COMMERCE",
+                symbol="boundary",
+                mode="value",
+                depth=DepthLevel.STANDARD,
+                expect="valuation",
+                charge=value + 8,
+            )
+            result = self.organ.invoke(invocation, patch)
+
+            assert result["value"] == value
+            assert result["tier"] == tier
+
     def test_assess_value_suggests_dreampoints(self):
         """Test value assessment suggests dreampoints for DREAM+ flag."""
         invocation = Invocation(
@@ -242,6 +349,44 @@ class TestChamberOfCommerce:
 
         assert result["suggested_currency"] == "looptokens"
 
+    def test_assess_value_repeats_return_independent_results(self):
+        """Test memoized valuations are not shared or stale across calls."""
+        invocation = Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="repeat",
+            mode="value",
+            depth=DepthLevel.STANDARD,
+            expect="valuation",
+            charge=60,
+            flags=["CANON+"],
+        )
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=60)
+
+        first = self.organ.invoke(invocation, patch)
+        first["components"]["flag_bonus"] = 999
+        second = self.organ.invoke(invocation, patch)
+
+        assert second["components"]["flag_bonus"] == 5
+        assert second["value"] == first["value"]
+
+    def test_assess_value_follows_config_changes(self, monkeypatch):
+        """Test valuation picks up changed coefficients despite caching."""
+        invocation = Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="config",
+            mode="value",
+            depth=DepthLevel.STANDARD,
+            expect="valuation",
+            charge=60,
+        )
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=60)
+
+        before = self.organ.invoke(invocation, patch)["value"]
+        monkeypatch.setitem(VALUATION_CONFIG, "base_cost", VALUATION_CONFIG["base_cost"] + 7)
+        after = self.organ.invoke(invocation, patch)["value"]
+
+        assert after == before - 7
+
     def test_trade_invalid_format(self):
         """Test trade with invalid format."""
         invocation = Invocation(
@@ -275,6 +420,7 @@ class TestChamberOfCommerce:
 
         assert result["status"] == "failed"
         assert "Invalid currency" in result["error"]
+        assert result["valid_currencies"] == [c.value for c in SymbolicCurrency]
 
     def test_trade_invalid_amount(self):
         """Test trade with invalid amount."""
@@ -348,6 +494,43 @@ class TestChamberOfCommerce:
         assert result["from_balance"] == 30  # 50 - 20
         assert result["to_balance"] == 20
 
+    def test_trade_parses_padded_fields_and_ignores_extras(self):
+        """Test trade fields are trimmed and segments past AMOUNT are ignored."""
+        self.organ.grant_balance("SELF", SymbolicCurrency.LOOPTOKENS, 50)
+
+        invocation = Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol=" self : archive : LoopTokens : 20 :note",
+            mode="trade",
+            depth=DepthLevel.STANDARD,
+            expect="trade_record",
+            charge=60,
+        )
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=60)
+
+        result = self.organ.invoke(invocation, patch)
+
+        assert result["status"] == "completed"
+        assert result["trade"]["from_entity"] == "SELF"
+        assert result["trade"]["to_entity"] == "ARCHIVE"
+        assert result["trade"]["amount"] == 20
+
+    def test_trade_three_fields_is_invalid_format(self):
+        """Test a trade missing the amount field is rejected as malformed."""
+        invocation = Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="SELF:ARCHIVE:looptokens",
+            mode="trade",
+            depth=DepthLevel.STANDARD,
+            expect="trade_record",
+            charge=60,
+        )
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=60)
+
+        result = self.organ.invoke(invocation, patch)
+
+        assert "Invalid trade format" in result["error"]
+
     def test_mint_charge_too_low(self):
         """Test minting with charge below threshold."""
         invocation = Invocation(
@@ -383,6 +566,26 @@ class TestChamberOfCommerce:
         assert result["mint"]["amount"] > 0
         assert result["new_balance"] > 0
 
+    def test_mint_tracks_daily_total_by_mint_date(self):
+        """Test daily minting is keyed by the mint timestamp's date."""
+        invocation = Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="SELF",
+            mode="mint",
+            depth=DepthLevel.STANDARD,
+            expect="mint_record",
+            charge=70,
+        )
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=70)
+
+        result = self.organ.invoke(invocation, patch)
+
+        minted_at = datetime.fromisoformat(result["mint"]["timestamp"])
+        day = minted_at.strftime("%Y-%m-%d")
+        assert self.organ._daily_minted == {day: result["mint"]["amount"]}
+        assert self.organ._day_key(datetime(2024, 2, 29, 23, 59)) == "2024-02-29"
+        assert self.organ._day_key(datetime(2024, 3, 1)) == "2024-03-01"
+
     def test_mint_dreampoints_with_flag(self):
         """Test minting dreampoints with DREAM+ flag."""
         invocation = Invocation(
@@ -418,6 +621,24 @@ class TestChamberOfCommerce:
 
         assert result["mint"]["currency"] == "looptokens"
 
+    def test_mint_currency_flags_ignore_case(self):
+        """Test mint currency selection matches flags case-insensitively."""
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=60)
+
+        def mint(flags):
+            return self.organ.invoke(Invocation(
+                organ="CHAMBER_OF_COMMERCE",
+                symbol="SELF",
+                mode="mint",
+                depth=DepthLevel.STANDARD,
+                expect="mint_record",
+                charge=60,
+                flags=flags,
+            ), patch)["mint"]["currency"]
+
+        assert mint(["dream+"]) == "dreampoints"
+        assert mint(["Law_Loop+"]) == "looptokens"
+
     def test_mint_higher_charge_more_currency(self):
         """Test higher charge mints more currency."""
         patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=90)
@@ -517,6 +738,52 @@ class TestChamberOfCommerce:
         for trade in result["trades"]:
             assert trade["from_entity"] == "SELF" or trade["to_entity"] == "SELF"
 
+    def test_query_ledger_filter_uses_index_in_order(self):
+        """Test filtered ledger lists each matching record once, oldest first."""
+        self.organ.grant_balance("SELF", SymbolicCurrency.LOOPTOKENS, 100)
+        patch = Patch(input_node="test", output_node="CHAMBER_OF_COMMERCE", tags=[], charge=60)
+
+        for symbol in ("SELF:A:looptokens:1", "A:SELF:looptokens:1", "SELF:SELF:looptokens:2"):
+            self.organ.invoke(Invocation(
+                organ="CHAMBER_OF_COMMERCE",
+                symbol=symbol,
+                mode="trade",
+                depth=DepthLevel.STANDARD,
+                expect="trade_record",
+                charge=60,
+            ), patch)
+        self.organ.invoke(Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="self",
+            mode="mint",
+            depth=DepthLevel.STANDARD,
+            expect="mint_record",
+            charge=80,
+        ), patch)
+
+        result = self.organ.invoke(Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="SELF",
+            mode="ledger",
+            depth=DepthLevel.STANDARD,
+            expect="ledger",
+            charge=50,
+        ), patch)
+
+        assert [t["amount"] for t in result["trades"]] == [1, 1, 2]
+        assert [m["recipient"] for m in result["mints"]] == ["SELF"]
+
+        self.organ.reset()
+        result = self.organ.invoke(Invocation(
+            organ="CHAMBER_OF_COMMERCE",
+            symbol="SELF",
+            mode="ledger",
+            depth=DepthLevel.STANDARD,
+            expect="ledger",
+            charge=50,
+        ), patch)
+        assert result["trades"] == []
+
     def test_check_balance(self):
         """Test checking balance."""
         self.organ.grant_balance("TEST_ENTITY", SymbolicCurrency.DREAMPOINTS, 50)
@@ -557,6 +824,48 @@ class TestChamberOfCommerce:
         assert "total_trades" in result
         assert "currency_in_circulation" in result
 
+    def test_circulation_tracks_credits_debits_and_restore(self):
+        """Test running circulation totals match the summed balances."""
+        self.organ.grant_balance("A", SymbolicCurrency.DREAMPOINTS, 40)
+        self.organ.grant_balance("B", SymbolicCurrency.DREAMPOINTS, 10)
+        self.organ._debit("B", SymbolicCurrency.DREAMPOINTS, 25)  # Clamped at zero
+        self.organ._debit("A", SymbolicCurrency.DREAMPOINTS, 15)
+
+        assert self.organ._circulation == self.organ._count_circulation()
+        assert self.organ._circulation["dreampoints"] == 25
+
+        state = self.organ.get_state()
+        self.organ.reset()
+        assert self.organ._circulation["dreampoints"] == 0
+
+        self.organ.restore_state(state)
+        assert self.organ._circulation["dreampoints"] == 25
+
+    def test_entity_totals_track_credits_debits_and_restore(self):
+        """Test running per-entity totals match the summed balances."""
+        self.organ.grant_balance("A", SymbolicCurrency.DREAMPOINTS, 40)
+        self.organ.grant_balance("A", SymbolicCurrency.LOOPTOKENS, 5)
+        self.organ._debit("A", SymbolicCurrency.LOOPTOKENS, 9)  # Clamped at zero
+        self.organ._debit("B", SymbolicCurrency.DREAMPOINTS, 3)
+
+        assert self.organ._entity_totals == self.organ._count_entity_totals()
+        assert self.organ._entity_totals["A"] == 40
+
+        state = self.organ.get_state()
+        self.organ.reset()
+        self.organ.restore_state(state)
+        assert self.organ._entity_totals["A"] == 40
+
+    def test_organ_is_slotted(self):
+        """Test the chamber carries no per-instance __dict__."""
+        assert not hasattr(self.organ, "__dict__")
+
+    def test_mode_handlers_are_shared_method_names(self):
+        """Test the mode table is class-level and names real handlers."""
+        for mode, handler in ChamberOfCommerce._MODE_HANDLERS.items():
+            assert mode in self.organ.get_valid_modes()
+            assert callable(getattr(self.organ, handler))
+
     def test_grant_balance_direct(self):
         """Test granting balance directly."""
         result = self.organ.grant_balance("ADMIN", SymbolicCurrency.MIRRORCREDITS, 1000)
@@ -4,6 +4,9 @@ RE:GE Orchestration Tests.
 Tests for Phase, Branch, RitualChain, ChainExecution, and orchestrator.
 """
 
+import copy
+import dataclasses
+
 import pytest
 from datetime import datetime
 
@@ -29,7 +32,7 @@ from rege.orchestration.registry import (
     get_chain_registry,
     reset_chain_registry,
 )
-from rege.orchestration.orchestrator import RitualChainOrchestrator
+from rege.orchestration.orchestrator import RitualChainOrchestrator, RoutingSignal
 from rege.orchestration.builtin_chains import (
     create_canonization_ceremony,
     create_contradiction_resolution,
@@ -99,6 +102,30 @@ class TestPhase:
         )
         assert phase.should_execute({}) is False
 
+    def test_should_execute_follows_condition_rebinding(self):
+        """Test a rebound condition replaces the one wrapped earlier."""
+        phase = Phase(name="test", organ="ORGAN", mode="mode")
+        assert phase.should_execute({}) is True
+
+        phase.condition = lambda ctx: ctx.get("ready", False)
+        assert phase.should_execute({}) is False
+
+        phase.condition = lambda ctx: ctx["missing_key"]
+        assert phase.should_execute({"ready": True}) is False
+
+        phase.condition = None
+        assert phase.should_execute({}) is True
+
+    def test_condition_is_a_dataclass_field(self):
+        """Test condition stays a declared field of Phase and Branch."""
+        assert "condition" in {f.name for f in dataclasses.fields(Phase)}
+        assert "condition" in {f.name for f in dataclasses.fields(Branch)}
+
+        cond = charge_condition()
+        phase = Phase(name="test", organ="ORGAN", mode="mode", condition=cond)
+        assert phase.condition is cond
+        assert "_condition" not in dataclasses.asdict(phase)
+
     def test_select_branch(self):
         """Test branch selection."""
         phase = Phase(name="test", organ="ORGAN", mode="mode")
@@ -127,6 +154,36 @@ class TestPhase:
         result = phase.select_branch({"value": 3})
         assert result is None
 
+    def test_is_static(self):
+        """Test static routing detection."""
+        phase = Phase(name="test", organ="ORGAN", mode="mode")
+        assert phase.is_static is True
+        assert phase.static_branch() is None
+
+        phase.branches.append(
+            Branch(name="low", condition=charge_condition(), target_phase="a", priority=1)
+        )
+        phase.branches.append(
+            Branch(name="high", condition=charge_condition(), target_phase="b", priority=5)
+        )
+        assert phase.is_static is True
+        assert phase.static_branch().name == "high"
+
+        phase.branches.append(
+            Branch(name="dynamic", condition=lambda ctx: True, target_phase="c")
+        )
+        assert phase.is_static is False
+
+        gated = Phase(
+            name="gated", organ="ORGAN", mode="mode", condition=charge_condition(71)
+        )
+        assert gated.is_static is False
+
+        gated.condition = charge_condition()
+        assert gated.is_static is True
+        phase.branches.pop()
+        assert phase.is_static is True
+
     def test_get_input_no_mapping(self):
         """Test input without mapping."""
         phase = Phase(name="test", organ="ORGAN", mode="mode")
@@ -226,6 +283,14 @@ class TestBranch:
         )
         assert branch.evaluate({}) is False
 
+    def test_branch_evaluate_follows_condition_rebinding(self):
+        """Test a rebound branch condition replaces the one wrapped earlier."""
+        branch = Branch(name="test", condition=lambda ctx: True, target_phase="target")
+        assert branch.evaluate({}) is True
+
+        branch.condition = lambda ctx: ctx["missing"]
+        assert branch.evaluate({}) is False
+
     def test_branch_to_dict(self):
         """Test branch serialization."""
         branch = Branch(
@@ -295,6 +360,11 @@ class TestConditionHelpers:
         assert cond({"charge": 90}) is False
         assert cond({}) is True  # Default 50
 
+    def test_charge_condition_static(self):
+        """Test full-range charge conditions are marked static."""
+        assert charge_condition()._static is True
+        assert charge_condition(min_charge=71)._static is False
+
     def test_tag_condition(self):
         """Test tag condition helper."""
         cond = tag_condition("CANON+")
@@ -629,6 +699,38 @@ class TestChainRegistry:
         assert "chain1" in chains
         assert "chain2" in chains
 
+    def test_get_all_and_chains_view(self):
+        """Test get_all is a copy and chains_view is a read-only live view."""
+        registry = ChainRegistry()
+        registry.register(RitualChain(name="chain1"))
+
+        view = registry.chains_view()
+        copy = registry.get_all()
+        with pytest.raises(TypeError):
+            view["chain2"] = RitualChain(name="chain2")
+
+        registry.register(RitualChain(name="chain2"))
+        assert set(view) == {"chain1", "chain2"}
+        assert set(copy) == {"chain1"}
+
+        copy["chain3"] = RitualChain(name="chain3")
+        assert "chain3" not in registry.list_chains()
+
+    def test_iter_state_sections(self):
+        """Test iter_state yields the sections exported by to_dict."""
+        registry = ChainRegistry()
+        registry.register(RitualChain(name="chain1"))
+        registry.add_execution(ChainExecution(chain_name="chain1"))
+
+        sections = list(registry.iter_state())
+
+        assert [name for name, _ in sections] == [
+            "chains",
+            "execution_history",
+            "max_history",
+        ]
+        assert dict(sections) == registry.to_dict()
+
     def test_add_execution(self):
         """Test adding execution to history."""
         registry = ChainRegistry()
@@ -648,6 +750,37 @@ class TestChainRegistry:
         assert found is not None
         assert found.execution_id == execution.execution_id
 
+    def test_get_execution_after_trim_and_clear(self):
+        """Test execution lookup tracks trimming and clearing."""
+        registry = ChainRegistry()
+        registry.set_max_history(2)
+        old = ChainExecution(chain_name="chain1")
+        kept = ChainExecution(chain_name="chain2")
+        newest = ChainExecution(chain_name="chain1")
+        for execution in (old, kept, newest):
+            registry.add_execution(execution)
+
+        assert registry.get_execution(old.execution_id) is None
+        assert registry.get_execution(kept.execution_id) is kept
+
+        registry.clear_history("chain1")
+        assert registry.get_execution(newest.execution_id) is None
+        assert registry.get_execution(kept.execution_id) is kept
+
+        registry.clear_history()
+        assert registry.get_execution(kept.execution_id) is None
+
+    def test_get_execution_from_dict(self):
+        """Test execution lookup works on an imported registry."""
+        registry = ChainRegistry()
+        execution = ChainExecution(chain_name="test")
+        registry.add_execution(execution)
+
+        restored = ChainRegistry.from_dict(registry.to_dict())
+        found = restored.get_execution(execution.execution_id)
+        assert found is not None
+        assert found.chain_name == "test"
+
     def test_get_executions_with_filter(self):
         """Test getting executions with chain filter."""
         registry = ChainRegistry()
@@ -658,6 +791,35 @@ class TestChainRegistry:
         executions = registry.get_executions(chain_name="chain1")
         assert len(executions) == 2
 
+    def test_get_executions_by_chain_after_eviction(self):
+        """Test per-chain history follows global eviction order."""
+        registry = ChainRegistry()
+        registry.set_max_history(3)
+        executions = [ChainExecution(chain_name=n) for n in ("a", "b", "a", "a")]
+        for execution in executions:
+            registry.add_execution(execution)
+
+        assert registry.get_executions(chain_name="a") == [executions[3], executions[2]]
+        assert registry.get_executions(chain_name="a", limit=1) == [executions[3]]
+        assert registry.get_executions(chain_name="missing") == []
+        assert registry.clear_history("missing") == 0
+        assert registry.clear_history("a") == 2
+        assert registry.get_executions() == [executions[1]]
+
+    def test_get_executions_limit_returns_independent_list(self):
+        """Test limited history reads return only the newest entries."""
+        registry = ChainRegistry()
+        executions = [ChainExecution(chain_name="test") for _ in range(5)]
+        for execution in executions:
+            registry.add_execution(execution)
+
+        latest = registry.get_executions(limit=2)
+        assert latest == [executions[4], executions[3]]
+
+        latest.clear()
+        assert len(registry.get_executions()) == 5
+        assert registry.get_executions(limit=0) == []
+
     def test_get_execution_stats(self):
         """Test getting execution statistics."""
         registry = ChainRegistry()
@@ -674,6 +836,101 @@ class TestChainRegistry:
         assert stats["completed"] == 1
         assert stats["failed"] == 1
 
+    def test_get_execution_stats_by_chain(self):
+        """Test statistics track trimming and per-chain clearing."""
+        registry = ChainRegistry()
+        registry.set_max_history(3)
+        for chain_name in ("a", "b", "a", "b"):
+            execution = ChainExecution(chain_name=chain_name)
+            execution.mark_completed()
+            registry.add_execution(execution)
+
+        assert registry.get_execution_stats()["total"] == 3
+        assert registry.get_execution_stats("a")["total"] == 1
+        assert registry.get_execution_stats("b")["total"] == 2
+
+        registry.clear_history("b")
+        assert registry.get_execution_stats()["total"] == 1
+        assert registry.get_execution_stats("b")["total"] == 0
+        assert registry.get_execution_stats()["status_breakdown"] == {"completed": 1}
+
+        registry.clear_history()
+        assert registry.get_execution_stats()["total"] == 0
+
+    def test_execution_stats_follow_status_changes(self):
+        """Test statistics see executions mutated after they were added."""
+        registry = ChainRegistry()
+        execution = ChainExecution(chain_name="test")
+        execution.mark_paused()
+        registry.add_execution(execution)
+        assert registry.get_execution_stats()["paused"] == 1
+
+        execution.mark_completed()
+
+        stats = registry.get_execution_stats()
+        assert stats["total"] == 1
+        assert stats["paused"] == 0
+        assert stats["completed"] == 1
+        assert registry.get_execution_stats("test")["completed"] == 1
+
+    def test_execution_stats_shared_between_registries(self):
+        """Test an execution held by two registries updates both stats."""
+        first = ChainRegistry()
+        second = ChainRegistry()
+        execution = ChainExecution(chain_name="test")
+        first.add_execution(execution)
+        second.add_execution(execution)
+
+        execution.mark_completed()
+
+        assert first.get_execution_stats()["completed"] == 1
+        assert second.get_execution_stats()["completed"] == 1
+        assert "_on_change" not in dataclasses.asdict(execution)
+        assert copy.deepcopy(execution) == execution
+
+    def test_add_execution_twice_appends(self):
+        """Test re-adding an execution records it again, as plain history did."""
+        registry = ChainRegistry()
+        execution = ChainExecution(chain_name="test")
+        other = ChainExecution(chain_name="test")
+        registry.add_execution(execution)
+        registry.add_execution(other)
+        registry.add_execution(execution)
+
+        assert registry.get_executions() == [execution, other, execution]
+        execution.mark_completed()
+        assert registry.get_execution_stats()["total"] == 3
+        assert registry.get_execution_stats()["completed"] == 2
+
+        registry.set_max_history(2)
+        assert registry.get_executions() == [execution, other]
+        assert registry.get_execution_stats("test")["total"] == 2
+        assert registry.get_execution_stats()["completed"] == 1
+
+        registry.set_max_history(1)
+        execution.mark_failed("late")
+        assert registry.get_execution_stats()["status_breakdown"] == {"failed": 1}
+        other.mark_failed("evicted")
+        assert registry.get_execution_stats()["failed"] == 1
+
+    def test_get_execution_returns_oldest_entry_with_id(self):
+        """Test lookup by a repeated ID returns the oldest retained entry."""
+        registry = ChainRegistry()
+        registry.set_max_history(2)
+        execution = ChainExecution(chain_name="test")
+        registry.add_execution(execution)
+
+        restored = ChainExecution.from_dict(execution.to_dict())
+        restored.mark_failed("boom")
+        registry.add_execution(restored)
+
+        assert registry.get_execution(execution.execution_id) is execution
+        assert registry.get_execution_stats()["total"] == 2
+        assert registry.get_execution_stats()["failed"] == 1
+
+        registry.add_execution(ChainExecution(chain_name="test"))
+        assert registry.get_execution(execution.execution_id) is restored
+
     def test_clear_history(self):
         """Test clearing execution history."""
         registry = ChainRegistry()
@@ -695,12 +952,41 @@ class TestChainRegistry:
         history = registry.get_executions()
         assert len(history) == 5
 
+    def test_set_max_history_shrink_and_grow(self):
+        """Test changing the limit keeps the most recent executions."""
+        registry = ChainRegistry()
+        for i in range(6):
+            registry.add_execution(ChainExecution(chain_name=f"chain{i}"))
+
+        registry.set_max_history(3)
+        assert [e.chain_name for e in registry.get_executions()] == [
+            "chain5",
+            "chain4",
+            "chain3",
+        ]
+
+        registry.set_max_history(10)
+        for i in range(6, 9):
+            registry.add_execution(ChainExecution(chain_name=f"chain{i}"))
+        assert len(registry.get_executions()) == 6
+        assert registry.get_executions(limit=1)[0].chain_name == "chain8"
+
     def test_global_registry_singleton(self):
         """Test global registry is singleton."""
         reg1 = get_chain_registry()
         reg2 = get_chain_registry()
         assert reg1 is reg2
 
+    def test_reset_global_registry(self):
+        """Test reset replaces the global registry with a fresh one."""
+        registry = get_chain_registry()
+        registry.register(RitualChain(name="chain1"))
+
+        reset_chain_registry()
+
+        assert get_chain_registry() is not registry
+        assert get_chain_registry().count() == 0
+
 
 class TestRitualChainOrchestrator:
     """Tests for RitualChainOrchestrator class."""
@@ -861,6 +1147,47 @@ class TestRitualChainOrchestrator:
         assert execution.status == ChainStatus.COMPLETED
         assert len(execution.phase_results) == 2
 
+    def test_resume_execution_skips_conditional_phase(self):
+        """Test resumed executions honour phase conditions."""
+        orchestrator = RitualChainOrchestrator()
+        orchestrator.define_chain(
+            "resume_skip_test",
+            [
+                Phase(name="phase1", organ="ORGAN", mode="mode"),
+                Phase(
+                    name="phase2",
+                    organ="ORGAN",
+                    mode="mode",
+                    condition=lambda ctx: False,
+                ),
+            ],
+        )
+
+        execution = orchestrator.execute_chain("resume_skip_test", step_mode=True)
+        execution = orchestrator.resume_execution(execution.execution_id)
+
+        assert execution.status == ChainStatus.COMPLETED
+        assert execution.phase_results[1].status == PhaseStatus.SKIPPED
+
+    def test_resume_execution_updates_stats(self):
+        """Test resumed executions are reflected in statistics."""
+        orchestrator = RitualChainOrchestrator()
+        orchestrator.define_chain(
+            "resume_stats_test",
+            [
+                Phase(name="phase1", organ="ORGAN", mode="mode"),
+                Phase(name="phase2", organ="ORGAN", mode="mode"),
+            ],
+        )
+
+        execution = orchestrator.execute_chain("resume_stats_test", step_mode=True)
+        assert orchestrator.get_execution_stats()["paused"] == 1
+
+        orchestrator.resume_execution(execution.execution_id)
+        stats = orchestrator.get_execution_stats()
+        assert stats["paused"] == 0
+        assert stats["completed"] == 1
+
     def test_cancel_execution(self):
         """Test cancelling paused execution."""
         orchestrator = RitualChainOrchestrator()
@@ -901,6 +1228,63 @@ class TestRitualChainOrchestrator:
         assert result["planned_phases"][0]["would_execute"] is True
         assert result["planned_phases"][1]["would_execute"] is False
 
+    def test_mock_execute_output(self):
+        """Test mock execution output is a fresh copy per call."""
+        orchestrator = RitualChainOrchestrator()
+        phase = Phase(name="phase1", organ="ORGAN", mode="mode")
+
+        first = orchestrator._mock_execute(phase, {"a": 1})
+        second = orchestrator._mock_execute(phase, {"b": 2})
+
+        assert first == {
+            "phase": "phase1",
+            "organ": "ORGAN",
+            "mode": "mode",
+            "input": {"a": 1},
+            "status": "mock_completed",
+        }
+        assert second["input"] == {"b": 2}
+        assert first is not second
+
+    def test_mock_execute_follows_phase_renames(self):
+        """Test mock output reflects phase fields changed after a run."""
+        orchestrator = RitualChainOrchestrator()
+        phase = Phase(name="phase1", organ="ORGAN", mode="mode")
+        orchestrator._mock_execute(phase, {})
+
+        phase.name = "renamed"
+        phase.organ = "OTHER"
+        phase.mode = "other_mode"
+        output = orchestrator._mock_execute(phase, {})
+
+        assert output["phase"] == "renamed"
+        assert output["organ"] == "OTHER"
+        assert output["mode"] == "other_mode"
+
+    def test_dry_run_static_matches_evaluated(self):
+        """Test the static dry-run walk plans the same path as evaluation."""
+        orchestrator = RitualChainOrchestrator()
+        chain = orchestrator.define_chain(
+            "static_dry_run_test",
+            [
+                Phase(name="phase1", organ="ORGAN", mode="mode"),
+                Phase(name="phase2", organ="ORGAN", mode="mode"),
+                Phase(name="phase3", organ="ORGAN", mode="mode"),
+            ],
+        )
+        chain.add_branch(
+            "phase1",
+            Branch(name="skip_ahead", condition=charge_condition(), target_phase="phase3"),
+        )
+
+        static_plan = orchestrator.dry_run("static_dry_run_test")
+        evaluated_plan = orchestrator.dry_run(
+            "static_dry_run_test", context={"charge": 50}
+        )
+
+        assert static_plan["planned_phases"] == evaluated_plan["planned_phases"]
+        assert [p["name"] for p in static_plan["planned_phases"]] == ["phase1", "phase3"]
+
     def test_get_execution_history(self):
         """Test getting execution history."""
         orchestrator = RitualChainOrchestrator()
@@ -928,6 +1312,89 @@ class TestRitualChainOrchestrator:
 
         assert stats["total"] >= 1
 
+    def test_escalation_triggers_read_only_mapping(self):
+        """Test escalation triggers stay a mapping that cannot be edited."""
+        targets = RitualChainOrchestrator.ESCALATION_TRIGGERS
+        assert targets["fusion_required"] == "FUSE01"
+        assert targets.get("unknown") is None
+        pairs = RitualChainOrchestrator._ESCALATION_PAIRS
+        assert set(targets) == {trigger for trigger, _ in pairs}
+        with pytest.raises(TypeError):
+            targets["fusion_required"] = "OTHER"
+
+    def test_escalation_on_high_charge(self):
+        """Test high charge context records a ritual court escalation."""
+        orchestrator = RitualChainOrchestrator()
+        orchestrator.define_chain(
+            "escalation_test",
+            [Phase(name="phase1", organ="ORGAN", mode="mode")],
+        )
+
+        execution = orchestrator.execute_chain("escalation_test", context={"charge": 90})
+
+        assert execution.escalations == ["RITUAL_COURT"]
+
+    def test_route_result_signals(self):
+        """Test phase results map to routing signals."""
+        orchestrator = RitualChainOrchestrator()
+        required = Phase(name="req", organ="ORGAN", mode="mode")
+        optional = Phase(name="opt", organ="ORGAN", mode="mode", required=False)
+        ok = PhaseResult(phase_name="req", status=PhaseStatus.COMPLETED)
+        failed = PhaseResult(phase_name="req", status=PhaseStatus.FAILED)
+
+        assert orchestrator._route_result(required, ok) == RoutingSignal.CONTINUE
+        assert orchestrator._route_result(required, failed) == RoutingSignal.ABORT
+        assert orchestrator._route_result(optional, failed) == RoutingSignal.RECOVER
+
+    def test_required_failure_compensates_and_aborts(self):
+        """Test a failing required phase runs compensation and fails the chain."""
+        orchestrator = RitualChainOrchestrator()
+
+        def fail(ctx):
+            raise RuntimeError("boom")
+
+        orchestrator.register_phase_handler("ORGAN", "fail", fail)
+        orchestrator.define_chain(
+            "abort_test",
+            [
+                Phase(
+                    name="phase1",
+                    organ="ORGAN",
+                    mode="fail",
+                    compensation=Phase(name="undo", organ="ORGAN", mode="mode"),
+                ),
+                Phase(name="phase2", organ="ORGAN", mode="mode"),
+            ],
+        )
+
+        execution = orchestrator.execute_chain("abort_test")
+
+        assert execution.status == ChainStatus.FAILED
+        assert execution.error == "boom"
+        assert execution.compensations_executed == ["phase1"]
+        assert [r.phase_name for r in execution.phase_results] == ["phase1", "undo"]
+
+    def test_optional_failure_continues(self):
+        """Test a failing optional phase does not stop the chain."""
+        orchestrator = RitualChainOrchestrator()
+
+        def fail(ctx):
+            raise RuntimeError("boom")
+
+        orchestrator.register_phase_handler("ORGAN", "fail", fail)
+        orchestrator.define_chain(
+            "recover_test",
+            [
+                Phase(name="phase1", organ="ORGAN", mode="fail", required=False),
+                Phase(name="phase2", organ="ORGAN", mode="mode"),
+            ],
+        )
+
+        execution = orchestrator.execute_chain("recover_test")
+
+        assert execution.status == ChainStatus.COMPLETED
+        assert [r.phase_name for r in execution.phase_results] == ["phase1", "phase2"]
+
 
 class TestBuiltinChains:
     """Tests for built-in ritual chains."""
@@ -2,10 +2,12 @@
 Tests for organ handlers.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 from rege.organs.heart_of_canon import HeartOfCanon
 from rege.organs.mirror_cabinet import MirrorCabinet
-from rege.organs.bloom_engine import BloomEngine
+from rege.organs.bloom_engine import BloomEngine, _SEASON_BY_MONTH
 from rege.organs.registry import OrganRegistry, register_default_organs
 from rege.core.models import Invocation, Patch, DepthLevel
 
@@ -172,6 +174,178 @@ class TestBloomEngine:
         assert not cycle.branch_version()
         assert cycle.status == "consolidated"
 
+    def test_active_cycles_follow_status_changes(self):
+        """Test the active-cycle index tracks initiate and consolidation."""
+        first = self.organ.initiate_bloom("First", "t", "A+", 7)
+        second = self.organ.initiate_bloom("Second", "t", "B+", 7)
+        assert self.organ.get_active_cycles() == []
+
+        first.initiate()
+        second.initiate()
+        assert self.organ.get_active_cycles() == [first, second]
+
+        self.organ.force_consolidation(first.cycle_id)
+        assert self.organ.get_active_cycles() == [second]
+
+        second.status = "pending"
+        assert self.organ.get_active_cycles() == []
+
+    def test_active_cycles_keep_creation_order(self):
+        """Test active cycles are listed by creation, not activation, order."""
+        first = self.organ.initiate_bloom("First", "t", "A+", 7)
+        second = self.organ.initiate_bloom("Second", "t", "B+", 7)
+
+        second.initiate()
+        first.initiate()
+
+        assert self.organ.get_active_cycles() == [first, second]
+
+    def test_schedule_checkpoints(self):
+        """Test checkpoints for tier and non-tier durations."""
+        for duration, expected_days in ((30, (7, 15, 22)), (10, (2, 5, 7))):
+            cycle = self.organ.initiate_bloom("Sched", "t", "S+", duration)
+            schedule = self.organ._generate_schedule(cycle)
+
+            dates = [
+                datetime.fromisoformat(c["date"]) - cycle.created_at
+                for c in schedule["checkpoints"]
+            ]
+            assert [d.days for d in dates] == list(expected_days)
+
+    def test_bloom_cycle_is_slotted(self):
+        """Test bloom cycles carry no per-instance __dict__."""
+        cycle = self.organ.initiate_bloom("Slots", "t", "S+", 7)
+
+        assert not hasattr(cycle, "__dict__")
+        with pytest.raises(AttributeError):
+            cycle.unknown_attribute = True
+
+    def test_bloom_cycle_timestamps_serialize_after_rebinding(self):
+        """Test cached ISO strings follow rebound cycle timestamps."""
+        cycle = self.organ.initiate_bloom("Iso", "t", "I+", 7)
+        cycle.created_at = datetime(2024, 3, 1)
+        cycle.ends_at = datetime(2024, 3, 8)
+
+        data = cycle.to_dict()
+        schedule = self.organ._generate_schedule(cycle)
+
+        assert data["created_at"] == "2024-03-01T00:00:00"
+        assert data["ends_at"] == "2024-03-08T00:00:00"
+        assert schedule["start_date"] == data["created_at"]
+        assert schedule["end_date"] == data["ends_at"]
+
+    def test_invoke_dispatches_modes(self):
+        """Test mode dispatch, including the seasonal_growth alias and fallback."""
+        patch = Patch(input_node="test", output_node="BLOOM_ENGINE", tags=[], charge=60)
+
+        def run(mode):
+            return self.organ.invoke(Invocation(
+                organ="BLOOM_ENGINE",
+                symbol="dispatch",
+                mode=mode,
+                depth=DepthLevel.STANDARD,
+                expect="mutated_fragment",
+                charge=60,
+            ), patch)
+
+        assert "mutation_type" in run("SEASONAL_GROWTH")
+        assert "initiation" in run("growth")
+        assert "new_version" in run("versioning")
+        assert run("unknown")["status"] == "bloom_acknowledged"
+
+    def test_initiate_blooms_batch(self):
+        """Test batch initiation registers cycles sharing one start time."""
+        cycles = self.organ.initiate_blooms([
+            ("Sweep_A", "sweep", "A+", 7),
+            ("Sweep_B", "sweep", "B+", 14),
+        ])
+
+        assert [c.phase for c in cycles] == ["Sweep_A", "Sweep_B"]
+        assert cycles[0].created_at == cycles[1].created_at
+        assert all(self.organ.get_cycle(c.cycle_id) is c for c in cycles)
+
+        cycles[1].initiate()
+        assert self.organ.get_active_cycles() == [cycles[1]]
+
+    def test_cycle_retention_evicts_oldest_finished(self):
+        """Test the cycle bound evicts only consolidated cycles, earliest first."""
+        self.organ.set_max_cycles(4)
+        active = self.organ.initiate_bloom("Active", "t", "A+", 7)
+        active.initiate()
+        pending = self.organ.initiate_bloom("Pending", "t", "P+", 7)
+        later = self.organ.initiate_bloom("Later", "t", "L+", 7)
+        done = self.organ.initiate_bloom("Done", "t", "D+", 7)
+        done.force_consolidation()
+        later.force_consolidation()
+        expired = self.organ.initiate_bloom("Expired", "t", "E+", 7)
+        expired.initiate()
+        expired.ends_at = datetime.now() - timedelta(days=1)
+
+        assert self.organ.get_cycle(done.cycle_id) is None
+        assert self.organ.get_cycle(later.cycle_id) is later
+
+        self.organ.initiate_bloom("Newest", "t", "N+", 7)
+        self.organ.initiate_bloom("Overflow", "t", "O+", 7)
+
+        assert self.organ.get_cycle(later.cycle_id) is None
+        for cycle in (active, pending, expired):
+            assert self.organ.get_cycle(cycle.cycle_id) is cycle
+
+        pending.initiate()
+        assert self.organ.get_active_cycles() == [active, pending, expired]
+
+    def test_cycle_retention_skips_reopened_cycles(self):
+        """Test a consolidated cycle that is reactivated is no longer evictable."""
+        self.organ.set_max_cycles(1)
+        cycle = self.organ.initiate_bloom("Reopened", "t", "R+", 7)
+        cycle.force_consolidation()
+        cycle.initiate()
+
+        self.organ.initiate_bloom("Next", "t", "N+", 7)
+
+        assert self.organ.get_cycle(cycle.cycle_id) is cycle
+        assert self.organ._consolidated_ids == {}
+
+    def test_cycle_retention_keeps_just_inserted_cycle(self):
+        """Test a new cycle survives trimming and reaches the active index."""
+        self.organ.set_max_cycles(1)
+        invocation = Invocation(
+            organ="BLOOM_ENGINE",
+            symbol="Seed",
+            mode="growth",
+            depth=DepthLevel.STANDARD,
+            expect="default",
+            charge=60,
+        )
+        patch = Patch(input_node="test", output_node="BLOOM_ENGINE", tags=[], charge=60)
+
+        first = self.organ.invoke(invocation, patch)["cycle"]["cycle_id"]
+        second = self.organ.invoke(invocation, patch)["cycle"]["cycle_id"]
+
+        assert self.organ.get_cycle(first) is not None
+        assert self.organ.get_cycle(second) is not None
+        assert {c.cycle_id for c in self.organ.get_active_cycles()} == {first, second}
+
+    def test_cycle_retention_keeps_whole_batch(self):
+        """Test batch initiation keeps every cycle it returns."""
+        self.organ.set_max_cycles(2)
+        cycles = self.organ.initiate_blooms([
+            (f"Sweep_{i}", "sweep", "S+", 7) for i in range(4)
+        ])
+
+        assert all(self.organ.get_cycle(c.cycle_id) is c for c in cycles)
+
+    def test_growth_recommendations_by_tier(self):
+        """Test recommendations accumulate at the 71 and 86 charge breaks."""
+        assert self.organ._growth_recommendations(70) == ["Monitor for emergent patterns"]
+        assert self.organ._growth_recommendations(71)[-1] == "Consider version branching"
+        assert len(self.organ._growth_recommendations(85)) == 2
+        assert self.organ._growth_recommendations(86)[-1] == "Prepare for metamorphosis checkpoint"
+
+        recommendations = self.organ._growth_recommendations(90)
+        recommendations.append("caller owned")
+        assert len(self.organ._growth_recommendations(90)) == 3
+
     def test_versioning_mode_tracks_versions(self):
         """Test versioning mode tracks fragment versions."""
         invocation = Invocation(
@@ -189,6 +363,94 @@ class TestBloomEngine:
         assert "new_version" in result
         assert "total_versions" in result
 
+    def test_versioning_appends_to_registry(self):
+        """Test repeated versioning numbers versions from the shared registry."""
+        invocation = Invocation(
+            organ="BLOOM_ENGINE",
+            symbol="Entity_v1.0",
+            mode="versioning",
+            depth=DepthLevel.STANDARD,
+            expect="version_map",
+            charge=60,
+        )
+        patch = Patch(input_node="test", output_node="BLOOM_ENGINE", tags=[], charge=60)
+
+        results = [self.organ.invoke(invocation, patch) for _ in range(3)]
+
+        assert [r["new_version"] for r in results] == [
+            "Entity_v1.0", "Entity_v2.0", "Entity_v3.0",
+        ]
+        assert results[-1]["version_map"] == self.organ._version_registry["Entity"]
+        assert results[-1]["consolidation_needed"]
+
+    def test_charge_tier_boundaries(self):
+        """Test duration and mutation type switch exactly at tier breaks."""
+        expected = {
+            50: (7, "drift"),
+            51: (14, "adaptation"),
+            70: (14, "adaptation"),
+            71: (21, "evolution"),
+            85: (21, "evolution"),
+            86: (30, "metamorphosis"),
+        }
+
+        for charge, (duration, mutation_type) in expected.items():
+            assert self.organ._calculate_duration(charge) == duration
+            assert self.organ._determine_mutation_type(charge) == mutation_type
+
+    def test_season_by_month(self):
+        """Test each month maps to its symbolic season."""
+        seasons = {
+            "SPRING": (3, 4, 5),
+            "SUMMER": (6, 7, 8),
+            "AUTUMN": (9, 10, 11),
+            "WINTER": (12, 1, 2),
+        }
+
+        for season, months in seasons.items():
+            for month in months:
+                assert _SEASON_BY_MONTH[month - 1] == season
+        assert self.organ._get_current_season() == _SEASON_BY_MONTH[datetime.now().month - 1]
+
+    def test_seasonal_mutation_shares_cycle_timestamp(self):
+        """Test a seasonal cycle and its first mutation share one timestamp."""
+        invocation = Invocation(
+            organ="BLOOM_ENGINE",
+            symbol="Shared clock",
+            mode="seasonal_mutation",
+            depth=DepthLevel.STANDARD,
+            expect="mutated_fragment",
+            charge=60,
+        )
+        patch = Patch(input_node="test", output_node="BLOOM_ENGINE", tags=[], charge=60)
+
+        cycle = self.organ.invoke(invocation, patch)["cycle"]
+
+        assert cycle["mutations"][0]["timestamp"] == cycle["created_at"]
+        created = datetime.fromisoformat(cycle["created_at"])
+        ends = datetime.fromisoformat(cycle["ends_at"])
+        assert (ends - created).days == cycle["duration"]
+
+    def test_generated_ids_format(self):
+        """Test cycle and fragment IDs keep the PREFIX_XXXXXXXX format."""
+        cycle = self.organ.initiate_bloom("Ids", "trigger", "IDS+", 7)
+        invocation = Invocation(
+            organ="BLOOM_ENGINE",
+            symbol="ids",
+            mode="seasonal_mutation",
+            depth=DepthLevel.STANDARD,
+            expect="mutated_fragment",
+            charge=60,
+        )
+        fragment = self.organ._create_mutated_fragment(invocation)
+
+        for generated, prefix in ((cycle.cycle_id, "CYCLE_"), (fragment["fragment_id"], "MUTANT_")):
+            assert generated.startswith(prefix)
+            suffix = generated[len(prefix):]
+            assert len(suffix) == 8
+            assert suffix == suffix.upper()
+            int(suffix, 16)
+
 
 class TestOrganRegistry:
     """Tests for OrganRegistry."""
@@ -4,6 +4,8 @@ Extended tests for organ handlers to improve coverage.
 Tests for: ArchiveOrder, CodeForge, DreamCouncil, EchoShell, MaskEngine, MythicSenate, RitualCourt
 """
 
+import json
+
 import pytest
 from datetime import datetime, timedelta
 
@@ -274,6 +276,26 @@ class TestCodeForgeExtended:
         assert "decision_tree" in result
         assert "branches" in result["decision_tree"]
 
+    def test_generated_trees_share_read_only_constants(self):
+        """Test trees and simulations reuse shared tuples instead of copies."""
+        first = self.organ._generate_decision_tree("first")
+        second = self.organ._generate_decision_tree("second")
+        sim = self.organ._generate_simulation("sim", 60)
+
+        assert second["branches"] is first["branches"]
+        assert isinstance(first["branches"], tuple)
+        assert isinstance(sim["rules"], tuple)
+        with pytest.raises(AttributeError):
+            sim["rules"].append("edited")
+        assert [b["label"] for b in second["branches"]] == [
+            "CRITICAL", "INTENSE", "ACTIVE", "BACKGROUND",
+        ]
+        assert json.loads(json.dumps(first))["branches"][0]["label"] == "CRITICAL"
+
+    def test_organ_is_slotted(self):
+        """Test the forge carries no per-instance __dict__."""
+        assert not hasattr(self.organ, "__dict__")
+
     def test_sim_mode_generates_simulation(self):
         """Test sim_mode generates simulation spec."""
         invocation = Invocation(
@@ -392,6 +414,24 @@ class TestDreamCouncilExtended:
 
         assert "fear" in emotional_layer["detected_emotions"]
 
+    def test_emotional_layer_reports_emotions_in_fixed_order(self):
+        """Test detected emotions keep their table order regardless of text order."""
+        dream = Dream(content="Heart full of RAGE, then peace", charge=70, dreamer="SELF")
+
+        emotional_layer = self.organ._analyze_emotional_layer(dream)
+
+        assert emotional_layer["detected_emotions"] == ["joy", "anger", "love"]
+        assert emotional_layer["primary_emotion"] == "joy"
+
+    def test_emotional_layer_undefined_without_keywords(self):
+        """Test content without emotion keywords is reported as undefined."""
+        dream = Dream(content="a quiet corridor", charge=30, dreamer="SELF")
+
+        emotional_layer = self.organ._analyze_emotional_layer(dream)
+
+        assert emotional_layer["detected_emotions"] == ["complex/undefined"]
+        assert emotional_layer["primary_emotion"] == "undefined"
+
     def test_ritual_recommendation_by_charge(self):
         """Test ritual recommendations vary by charge."""
         low_dream = Dream(content="test", charge=40, dreamer="SELF")
@@ -559,6 +599,22 @@ class TestEchoShellExtended:
 
         assert result["latent_status"] is True
 
+    def test_latent_pool_keeps_entry_order_without_duplicates(self):
+        """Test latent echoes are listed once each, in the order they went latent."""
+        first = Echo(content="first", charge=20, source="TEST")
+        second = Echo(content="second", charge=15, source="TEST")
+        for echo in (first, second):
+            self.organ._echoes[echo.echo_id] = echo
+            self.organ._update_latent_pool(echo)
+        self.organ._update_latent_pool(first)
+
+        assert self.organ.get_latent_echoes() == [first, second]
+
+        first.charge = 60
+        self.organ._update_latent_pool(first)
+
+        assert self.organ.get_latent_echoes() == [second]
+
     def test_recursion_depth_tracking(self):
         """Test depth tracking for patches."""
         patch = Patch(input_node="test", output_node="ECHO_SHELL", tags=[], charge=50)